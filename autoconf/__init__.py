@@ -91,6 +91,7 @@ from . import exc
 from .tools.decorators import cached_property
 from .conf import Config
 from .conf import instance
+from . import instrumentation
 from .json_prior.config import default_prior
 from .json_prior.config import make_config_for_class
 from .json_prior.config import path_for_class
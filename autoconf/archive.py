@@ -0,0 +1,230 @@
+"""
+Read configuration from a zip archive instead of a directory.
+
+A path inside an archive is written as if the archive were a directory, e.g.
+``bundle.zip/priors``. The whole archive is read with a single sequential read the
+first time it is used and every config and prior file is then served from memory,
+which avoids thousands of small stat and open calls on network filesystems.
+
+Pack a config directory into an archive with:
+
+    python -m autoconf.archive path/to/config config.zip
+"""
+import argparse
+import importlib.resources
+import io
+import os
+import threading
+import zipfile
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional, Tuple, Union
+
+ARCHIVE_SUFFIX = ".zip"
+
+
+class ArchiveStat(NamedTuple):
+    st_mtime_ns: int
+    st_size: int
+
+
+class ArchiveEntry:
+    __slots__ = ("name", "_is_dir", "size", "index")
+
+    def __init__(self, name: str, is_dir: bool, size: int, index: "ArchiveIndex"):
+        """
+        A file or directory in an archive, with the same is_dir and stat methods
+        as os.DirEntry.
+        """
+        self.name = name
+        self._is_dir = is_dir
+        self.size = size
+        self.index = index
+
+    def is_dir(self) -> bool:
+        return self._is_dir
+
+    def stat(self) -> ArchiveStat:
+        """
+        The modification time is that of the archive so any change to the archive
+        is treated as a change to every file in it.
+        """
+        return ArchiveStat(self.index.stamp[0], self.size)
+
+
+class ArchiveMember:
+    __slots__ = ("index", "member")
+
+    def __init__(self, index: "ArchiveIndex", member: str):
+        """
+        A file in an archive which can be passed to the parsers in
+        autoconf.parsers and to the parse cache in place of a path.
+
+        Parameters
+        ----------
+        index
+            The archive
+        member
+            The path of the file in the archive
+        """
+        self.index = index
+        self.member = member
+
+    @property
+    def cache_key(self) -> Tuple[str, str]:
+        return str(self.index.path), self.member
+
+    @property
+    def stamp(self) -> Tuple[int, int]:
+        return self.index.stamp
+
+    @property
+    def suffix(self) -> str:
+        return os.path.splitext(self.member)[1]
+
+    def open_binary(self) -> io.BytesIO:
+        return io.BytesIO(self.index.read(self.member))
+
+    def __str__(self):
+        return f"{self.index.path}/{self.member}"
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {self}>"
+
+
+class ArchiveIndex:
+    def __init__(self, path: Union[str, Path]):
+        """
+        The contents of a zip archive, read into memory in one go.
+
+        Parameters
+        ----------
+        path
+            The path to the archive
+        """
+        self.path = Path(path)
+        stat = os.stat(self.path)
+        self.stamp = (stat.st_mtime_ns, stat.st_size)
+        with open(self.path, "rb") as f:
+            self._zip = zipfile.ZipFile(io.BytesIO(f.read()))
+        self._lock = threading.Lock()
+
+        self.directories: Dict[str, Dict[str, ArchiveEntry]] = {"": dict()}
+        for info in self._zip.infolist():
+            parts = info.filename.rstrip("/").split("/")
+            for i in range(len(parts) - 1):
+                self._add(parts[:i], parts[i], True, 0)
+            self._add(parts[:-1], parts[-1], info.is_dir(), info.file_size)
+
+    def __reduce__(self):
+        # The archive is indexed again rather than pickling its contents
+        return archive_index, (self.path,)
+
+    def _add(self, parent_parts, name: str, is_dir: bool, size: int):
+        parent = "/".join(parent_parts)
+        entries = self.directories.setdefault(parent, dict())
+        if name not in entries:
+            entries[name] = ArchiveEntry(name, is_dir, size, self)
+        if is_dir:
+            self.directories.setdefault("/".join(list(parent_parts) + [name]), dict())
+
+    def read(self, member: str) -> bytes:
+        """
+        The contents of a file in the archive.
+        """
+        with self._lock:
+            try:
+                return self._zip.read(member)
+            except KeyError as e:
+                raise FileNotFoundError(f"{member} not found in {self.path}") from e
+
+
+_indices: Dict[str, ArchiveIndex] = dict()
+_indices_lock = threading.Lock()
+
+
+def archive_index(path: Union[str, Path]) -> ArchiveIndex:
+    """
+    The index for an archive. Indices are shared by every config layer and prior
+    config in the process and re-read if the archive changes.
+    """
+    resolved = os.path.realpath(path)
+    stat = os.stat(resolved)
+    with _indices_lock:
+        index = _indices.get(resolved)
+        if index is None or index.stamp != (stat.st_mtime_ns, stat.st_size):
+            index = ArchiveIndex(resolved)
+            _indices[resolved] = index
+        return index
+
+
+def split_archive_path(path: Union[str, Path]) -> Optional[Tuple[Path, str]]:
+    """
+    If a path is a zip archive or a path inside one split it into the path of the
+    archive and the path within it.
+
+    Returns
+    -------
+    The archive path and the inner path, or None if the path is not in an archive
+    """
+    if ARCHIVE_SUFFIX not in str(path):
+        return None
+    parts = Path(path).parts
+    for i in range(len(parts), 0, -1):
+        candidate = Path(*parts[:i])
+        if candidate.suffix == ARCHIVE_SUFFIX and candidate.is_file():
+            return candidate, "/".join(parts[i:])
+    return None
+
+
+def resource_path(package: str, resource: str = "config") -> Path:
+    """
+    The path to a resource directory shipped with a package, e.g. its config.
+
+    If the package was imported from a zip archive the returned path points inside
+    that archive and can be passed to Config or Config.push as a drop-in layer.
+
+    Parameters
+    ----------
+    package
+        The name of the package
+    resource
+        The name of the directory in the package
+    """
+    traversable = importlib.resources.files(package) / resource
+    if isinstance(traversable, zipfile.Path):
+        return Path(traversable.root.filename) / traversable.at.rstrip("/")
+    return Path(str(traversable))
+
+
+def pack(directory: Union[str, Path], archive_path: Union[str, Path]):
+    """
+    Pack a config directory, including priors, into a zip archive.
+
+    Parameters
+    ----------
+    directory
+        The config directory
+    archive_path
+        The archive to create
+    """
+    directory = Path(directory)
+    with zipfile.ZipFile(archive_path, "w", zipfile.ZIP_DEFLATED) as archive:
+        for root, dirnames, filenames in os.walk(directory):
+            dirnames.sort()
+            for filename in sorted(filenames):
+                path = Path(root) / filename
+                archive.write(path, path.relative_to(directory).as_posix())
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Pack a config directory into a zip archive for autoconf"
+    )
+    parser.add_argument("directory", help="The config directory to pack")
+    parser.add_argument("archive", help="The zip archive to create")
+    args = parser.parse_args()
+    pack(args.directory, args.archive)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,66 +1,430 @@
+import functools
+import hashlib
+import itertools
 import logging
 import logging.config
 import os
 import shutil
+import threading
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
 from functools import wraps
 from pathlib import Path
 from typing import Optional, Union, Dict, MutableMapping
 
-import yaml
 
+from autoconf import parsers
 from autoconf.directory_config import (
     RecursiveConfig,
+    DictLayer,
     PriorConfigWrapper,
     AbstractConfig,
+    DictConfig,
+    NoValue,
+    config_suffixes,
     family,
 )
-from autoconf.exc import ConfigException
+from autoconf.content_hash import dict_digest, layer_digest
+from autoconf.exc import ConfigException, MissingConfigError, MissingFamilyError
+from autoconf.frozen import FrozenConfig
 from autoconf.json_prior.config import JSONPriorConfig
+from autoconf.snapshot import ConfigSnapshot, snapshot_directory_from_environment
+from autoconf.tools.lock import ReadWriteLock
 
 logger = logging.getLogger(__name__)
 
 LOGGING_CONFIG_FILE = "logging.yaml"
 
+# Values overridden for the current thread or asyncio task keyed by
+# (config, path of lower case keys)
+_overrides = ContextVar("config_overrides", default={})
+# Numbers for the names of dict layers pushed without a name
+_dict_layer_count = itertools.count()
+
+# Output paths overridden for the current thread or asyncio task keyed by config
+_output_path_overrides = ContextVar("config_output_path_overrides", default={})
+
 
 def get_matplotlib_backend():
-    try:
-        return instance["visualize"]["general"]["general"]["backend"]
-    except KeyError:
-        return "default"
+    return instance.get("visualize.general.general.backend", default="default")
 
 
-class DictWrapper(MutableMapping):
-    def __delitem__(self, v) -> None:
-        del self._dict[v]
+@functools.lru_cache(maxsize=1024)
+def _compile_path(path: str):
+    """
+    Split a dotted path through config into lower case keys
+    """
+    return tuple(path.lower().split("."))
 
-    def __len__(self) -> int:
-        return len(self._dict)
 
-    def __iter__(self):
-        return iter(self._dict)
+class DictWrapper(MutableMapping):
+    __slots__ = (
+        "_dict",
+        "_removed",
+        "_key_maps",
+        "_layers",
+        "paths",
+        "owner",
+        "key_path",
+        "_family_misses",
+    )
+
+    def __init__(
+        self,
+        paths,
+        layers=(),
+        owner: Optional["Config"] = None,
+        key_path: tuple = (),
+    ):
+        """
+        A case-insensitive view of configuration merged across several layers.
+
+        Values are only looked up in the layers, and files only parsed, when a key
+        is first accessed. The result is then held so subsequent access is a single
+        dictionary lookup. Values may be set or deleted to override configuration.
 
-    def __init__(self, paths):
+        Parameters
+        ----------
+        paths
+            The paths of the config directories, used in error messages
+        layers
+            Configuration in order of priority. The first layer which contains a key
+            determines its value unless every layer containing it holds nested
+            configuration, in which case that configuration is merged.
+        owner
+            The Config this belongs to, which is notified when a value is changed
+        key_path
+            The keys from the root of the Config to this dictionary, used to find
+            values overridden with Config.override
+        """
         self._dict = dict()
+        self._removed = set()
+        self._key_maps = dict()
+        self._layers = list(layers)
         self.paths = paths
+        self.owner = owner
+        self.key_path = key_path
+        self._family_misses = dict()
+
+    def __getstate__(self):
+        # The owner is restored by Config.__setstate__ when a Config is unpickled
+        return {
+            name: getattr(self, name)
+            for name in self.__slots__
+            if name not in ("owner", "_family_misses")
+        }
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
+        self.owner = None
+        self._family_misses = dict()
+
+    def _set_owner(self, owner: "Config"):
+        self.owner = owner
+        for value in self._dict.values():
+            if isinstance(value, DictWrapper):
+                value._set_owner(owner)
+
+    @property
+    def generation(self) -> int:
+        """
+        The generation of the Config this belongs to, which changes whenever
+        configuration changes.
+        """
+        if self.owner is None:
+            return 0
+        return self.owner.generation
+
+    def _changed(self, key, value=NoValue):
+        self._family_misses = dict()
+        if self.owner is not None:
+            self.owner._edited(self.key_path + (key,), value)
+
+    def _discard(self, key):
+        """
+        Forget the value held for a key, including a value set or deleted in
+        memory, so it is read from the layers again.
+        """
+        self._dict.pop(key, None)
+        self._removed.discard(key)
+        if self.owner is not None:
+            self.owner._discarded(self.key_path + (key,))
+
+    def __delitem__(self, key) -> None:
+        if isinstance(key, str):
+            key = key.lower()
+        if key not in self:
+            raise KeyError(key)
+        self._dict.pop(key, None)
+        self._removed.add(key)
+        self._changed(key)
+
+    def __len__(self) -> int:
+        return len(self._materialize())
+
+    def __iter__(self):
+        return iter(self._materialize())
 
     def __contains__(self, item):
-        return item.lower() in self._dict
+        if isinstance(item, str):
+            item = item.lower()
+        return self.lookup(item) is not NoValue
 
     def items(self):
-        return self._dict.items()
+        return self._materialize().items()
 
     def __setitem__(self, key, value):
         if isinstance(key, str):
             key = key.lower()
+        self._removed.discard(key)
         self._dict[key] = value
+        self._changed(key, value)
 
     def __getitem__(self, key):
+        value = self.lookup(key)
+        if value is NoValue:
+            if isinstance(key, str):
+                key = key.lower()
+            raise MissingConfigError(key, self.paths)
+        return value
+
+    def lookup(self, key, default=NoValue):
+        """
+        Get a value without raising an exception if it is not present.
+
+        Parameters
+        ----------
+        key
+            The case-insensitive key of the value
+        default
+            Returned if there is no value for the key
+
+        Returns
+        -------
+        The value or the default
+        """
         if isinstance(key, str):
             key = key.lower()
+        overrides = _overrides.get()
+        if overrides:
+            value = overrides.get((self.owner, self.key_path + (key,)), NoValue)
+            if value is not NoValue:
+                return value
+        value = self._dict.get(key, NoValue)
+        if value is NoValue:
+            with self._read_lock():
+                value = self._resolve(key)
+        if value is NoValue:
+            return default
+        return value
+
+    def _read_lock(self):
+        if self.owner is None:
+            return nullcontext()
+        return self.owner.lock.read()
+
+    def _key_map(self, index: int) -> dict:
+        """
+        Map lower case keys to the keys used by the layer at the given index
+        """
         try:
-            return self._dict[key]
+            return self._key_maps[index]
         except KeyError:
-            raise KeyError(f"key {key} not found in paths {self.paths_string}")
+            pass
+        key_map = dict()
+        try:
+            for key in self._layers[index].keys():
+                key_map[key.lower() if isinstance(key, str) else key] = key
+        except KeyError as e:
+            logger.debug(e)
+        self._key_maps[index] = key_map
+        return key_map
+
+    def _layer_value(self, index: int, key):
+        """
+        Get the value for a key from one layer, or NoValue if the layer does not
+        contain it.
+        """
+        key_map = self._key_map(index)
+        if key not in key_map:
+            return NoValue
+        return self._layers[index].lookup(key_map[key])
+
+    def _resolve(self, key):
+        """
+        Find the value for a key by searching layers in order of priority and
+        hold it for subsequent access.
+
+        Returns
+        -------
+        The value or NoValue if the key is not present in any layer
+        """
+        if key in self._removed or not isinstance(key, str):
+            return NoValue
+
+        child_layers = [None] * len(self._layers)
+        found = False
+        for index, layer in enumerate(self._layers):
+            if layer is None:
+                continue
+            value = self._layer_value(index, key)
+            if value is NoValue:
+                continue
+            if not isinstance(value, AbstractConfig):
+                if not found:
+                    return self._dict.setdefault(key, value)
+                break
+            child_layers[index] = value
+            found = True
+
+        if not found:
+            return NoValue
+
+        value = DictWrapper(
+            self.paths,
+            child_layers,
+            owner=self.owner,
+            key_path=self.key_path + (key,),
+        )
+        return self._dict.setdefault(key, value)
+
+    def insert_layer(self, index: int, layer: Optional[AbstractConfig]):
+        """
+        Add a layer of configuration at a given priority without discarding values
+        which have already been resolved and are unaffected by the new layer.
+
+        Parameters
+        ----------
+        index
+            The position of the layer, with 0 being the highest priority
+        layer
+            Configuration for this level of the tree, or None if the new layer has no
+            configuration at this level
+        """
+        self._layers.insert(index, layer)
+        self._key_maps = {
+            (i if i < index else i + 1): key_map
+            for i, key_map in self._key_maps.items()
+        }
+
+        key_map = dict() if layer is None else self._key_map(index)
+        for key in self._removed & key_map.keys():
+            self._discard(key)
+        for key, value in list(self._dict.items()):
+            if key not in key_map:
+                if isinstance(value, DictWrapper):
+                    value.insert_layer(index, None)
+                continue
+            if isinstance(value, DictWrapper):
+                new_value = self._layer_value(index, key)
+                if isinstance(new_value, AbstractConfig):
+                    value.insert_layer(index, new_value)
+                    continue
+            self._discard(key)
+
+    def remove_layer(self, index: int):
+        """
+        Remove the layer of configuration at a given priority, discarding only
+        values which it may have contributed to.
+
+        Parameters
+        ----------
+        index
+            The position of the layer, with 0 being the highest priority
+        """
+        key_map = dict() if self._layers[index] is None else self._key_map(index)
+
+        del self._layers[index]
+        self._key_maps = {
+            (i if i < index else i - 1): key_map
+            for i, key_map in self._key_maps.items()
+            if i != index
+        }
+
+        for key in self._removed & key_map.keys():
+            self._discard(key)
+        for key, value in list(self._dict.items()):
+            if isinstance(value, DictWrapper):
+                value.remove_layer(index)
+                if any(layer is not None for layer in value._layers):
+                    continue
+                self._discard(key)
+            elif key in key_map:
+                self._discard(key)
+
+    def invalidate(self, key_path: tuple):
+        """
+        Discard values resolved along a key path so they are read from the layers
+        again, e.g. after the file they came from has been edited. Values
+        elsewhere in the tree are kept.
+
+        Parameters
+        ----------
+        key_path
+            Keys from this dictionary to the configuration which changed
+        """
+        self._key_maps = dict()
+        self._family_misses = dict()
+        key = key_path[0].lower()
+        value = self._dict.get(key)
+        if (
+            isinstance(value, DictWrapper)
+            and len(key_path) > 1
+            and all(
+                (layer is None) == (key not in self._key_map(index))
+                for index, layer in enumerate(value._layers)
+            )
+        ):
+            value.invalidate(key_path[1:])
+        else:
+            self._discard(key)
+
+    def _materialize(self) -> dict:
+        """
+        Resolve every key in every layer. Values overridden for the current thread
+        or asyncio task with Config.override replace resolved values.
+        """
+        with self._read_lock():
+            self._resolve_all()
+        overridden = self._overridden()
+        if overridden:
+            return {**self._dict, **overridden}
+        return self._dict
+
+    def _overridden(self) -> dict:
+        """
+        Values overridden with Config.override for keys of this dictionary
+        """
+        overrides = _overrides.get()
+        if not overrides:
+            return dict()
+        depth = len(self.key_path) + 1
+        return {
+            key_path[-1]: value
+            for (config, key_path), value in overrides.items()
+            if config is self.owner
+            and len(key_path) == depth
+            and key_path[:-1] == self.key_path
+        }
+
+    def _resolve_all(self):
+        for index in reversed(range(len(self._layers))):
+            if self._layers[index] is None:
+                continue
+            for key in self._key_map(index):
+                if key not in self._dict and key not in self._removed:
+                    self._resolve(key)
+
+    def dict(self) -> dict:
+        """
+        Resolve every key and convert this and any nested configuration into
+        plain dictionaries.
+        """
+        return {
+            key: value.dict() if isinstance(value, DictWrapper) else value
+            for key, value in self.items()
+        }
 
     @property
     def paths_string(self):
@@ -70,18 +434,33 @@ class DictWrapper(MutableMapping):
         return repr(self._dict)
 
     def family(self, cls):
-        for item in family(cls):
-            try:
-                return self[item]
-            except KeyError:
-                pass
-        raise KeyError(
-            f"config for {cls} or its parents not found in paths {self.paths_string}"
-        )
+        """
+        Get configuration for a class or, failing that, the first of its ancestors
+        for which there is configuration, keyed by class name.
+
+        Classes for which no configuration is found are remembered until
+        configuration changes so repeated failed lookups do no work. Misses are
+        neither remembered nor used while overrides are active, since overrides
+        only apply to the current thread or asyncio task.
+        """
+        overridden = bool(_overrides.get())
+        if overridden or self._family_misses.get(cls) != self.generation:
+            for item in family(cls):
+                value = self.lookup(item.__name__)
+                if value is not NoValue:
+                    return value
+            if not overridden:
+                self._family_misses[cls] = self.generation
+        raise MissingFamilyError(cls, self.paths)
 
 
 class Config:
-    def __init__(self, *config_paths, output_path: Union[str, Path] = "output"):
+    def __init__(
+        self,
+        *config_paths,
+        output_path: Union[str, Path] = "output",
+        snapshot_directory: Optional[Union[str, Path]] = None,
+    ):
         """
         Singleton to manage configuration.
 
@@ -101,6 +480,12 @@ class Config:
             paths
         output_path
             The path where data should be saved.
+        snapshot_directory
+            A directory in which to store a compiled snapshot of the merged
+            configuration. Subsequent processes with the same config paths load the
+            snapshot with a single read unless a config file has changed. Defaults to
+            the PYAUTO_CONFIG_SNAPSHOT_DIR environment variable; no snapshot is used
+            if neither is set.
         """
         for config_path in config_paths:
             if Path(config_path).name == "output":
@@ -108,41 +493,165 @@ class Config:
                     f"{config_path} passed as config path. Did you mean to use output_path={config_path}?"
                 )
 
+        self.lock = ReadWriteLock()
         self._prior_config = None
+        self._prior_configs = dict()
+        self._layer_digests = dict()
+        self._edits = dict()
+        self._generation = 0
+        self._generation_lock = threading.Lock()
+        self._path_cache = (None, dict())
+        self.snapshot_directory = (
+            snapshot_directory or snapshot_directory_from_environment()
+        )
 
         self._configs = list()
-        self._dict = DictWrapper(self.paths)
+        self._dict = None
 
         self.configs = list(map(RecursiveConfig, config_paths))
 
         self.output_path = output_path
 
+    # Locks and caches which are recreated rather than pickled
+    _UNPICKLED = (
+        "lock",
+        "_generation_lock",
+        "_prior_config",
+        "_prior_configs",
+        "_layer_digests",
+        "_path_cache",
+    )
+
+    def __getstate__(self):
+        return {
+            name: value
+            for name, value in self.__dict__.items()
+            if name not in self._UNPICKLED
+        }
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.lock = ReadWriteLock()
+        self._generation_lock = threading.Lock()
+        self._prior_config = None
+        self._prior_configs = dict()
+        self._layer_digests = dict()
+        self._path_cache = (None, dict())
+        if self._dict is not None:
+            self._dict._set_owner(self)
+
+    @property
+    def generation(self) -> int:
+        """
+        A counter which increases whenever configuration changes: when a layer is
+        pushed or reloaded, a value is set or deleted, or an override is entered or
+        left. Caches built from configuration can store the generation and check it
+        is unchanged before reuse.
+        """
+        return self._generation
+
+    def _next_generation(self):
+        with self._generation_lock:
+            self._generation += 1
+
+    def _edited(self, key_path: tuple, value):
+        self._edits[key_path] = value
+        self._next_generation()
+
+    def _discarded(self, key_path: tuple):
+        """
+        Forget edits at or below a key path when the value there is discarded
+        """
+        if not self._edits:
+            return
+        depth = len(key_path)
+        for edited in [path for path in self._edits if path[:depth] == key_path]:
+            del self._edits[edited]
+
+    def _reset_dict(self):
+        """
+        Discard the merged config dictionary, along with any edits made to it
+        """
+        self._dict = None
+        self._edits = dict()
+
+    @property
+    def content_hash(self) -> str:
+        """
+        A stable hash of the effective configuration, the same in any process with
+        the same config files, values set in memory and active overrides.
+
+        Each config directory is hashed once from the contents of its config and
+        prior files and only hashed again when it is reloaded. Configuration which
+        is identical but split differently between files or directories may hash
+        differently, so equal hashes mean equal configuration but not the reverse.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for config in self._configs:
+            digest.update(self._layer_digest(config).encode())
+        overrides = sorted(
+            (key_path, value)
+            for (config, key_path), value in _overrides.get().items()
+            if config is self
+        )
+        edits = sorted(self._edits.items())
+        for label, changes in (("edits", edits), ("overrides", overrides)):
+            digest.update(label.encode())
+            for key_path, value in changes:
+                digest.update(repr((key_path, value)).encode())
+        return digest.hexdigest()
+
+    def _layer_digest(self, config: AbstractConfig) -> str:
+        if isinstance(config, DictLayer):
+            return dict_digest(config.d)
+        try:
+            return self._layer_digests[str(config.path)]
+        except KeyError:
+            value = layer_digest(config.manifest)
+            self._layer_digests[str(config.path)] = value
+            return value
+
     @property
     def dict(self):
         """
         A dictionary containing configuration loaded from directories and files.
 
-        Lazily recurse directories to load configuration.
+        Configuration is loaded lazily so only files on the path of keys which are
+        accessed are parsed.
         """
         if self._dict is None:
-            self._dict = DictWrapper(self.paths)
-
-            def recurse_config(config, d):
-                try:
-                    for key, value in config.items():
-                        if isinstance(value, AbstractConfig):
-                            if key not in d:
-                                d[key] = DictWrapper(self.paths)
-                            recurse_config(value, d=d[key])
-                        else:
-                            d[key] = value
-                except KeyError as e:
-                    logger.debug(e)
-
-            for config_ in reversed(self._configs):
-                recurse_config(config_, self._dict)
+            with self.lock.write():
+                if self._dict is None:
+                    self._dict = self._load_dict()
         return self._dict
 
+    def _load_dict(self) -> DictWrapper:
+        """
+        Create the merged view of configuration, using the compiled snapshot if
+        snapshots are enabled and it is up to date.
+        """
+        if self.snapshot_directory is None or any(
+            isinstance(config, DictLayer) for config in self._configs
+        ):
+            return DictWrapper(self.paths, self._configs, owner=self)
+
+        snapshot = ConfigSnapshot(
+            self.snapshot_directory, [config.manifest for config in self._configs]
+        )
+        tree = snapshot.load()
+        if tree is not None:
+            return DictWrapper(self.paths, [DictConfig(tree)], owner=self)
+
+        d = DictWrapper(self.paths, self._configs, owner=self)
+        # Overrides for the current context must not be saved in the snapshot
+        token = _overrides.set(dict())
+        try:
+            tree = d.dict()
+        finally:
+            _overrides.reset(token)
+        snapshot.save(tree)
+        return d
+
     def configure_logging(self):
         """
         Set the most up to date logging configuration
@@ -162,13 +671,12 @@ class Config:
         for which it exists.
         """
         for config in self.configs:
-            path = config.path
-            try:
-                if LOGGING_CONFIG_FILE in os.listdir(config.path):
-                    with open(path / LOGGING_CONFIG_FILE) as f:
-                        return yaml.safe_load(f)
-            except FileNotFoundError:
+            if isinstance(config, DictLayer):
+                continue
+            if not config.manifest.exists:
                 logger.debug(f"No configuration found at path {config.path}")
+            elif LOGGING_CONFIG_FILE in config.manifest:
+                return parsers.load_yaml(config.manifest.file(LOGGING_CONFIG_FILE))
         return None
 
     @property
@@ -178,16 +686,239 @@ class Config:
     @configs.setter
     def configs(self, configs):
         """
-        When the list of configs is updated this invalidates the current config
-        dictionary
+        When the list of configs is updated the merged config dictionary is updated
+        to add or remove the changed layers. Values already resolved from unchanged
+        layers are kept.
         """
+        with self.lock.write():
+            self._set_configs(configs)
+
+    def _set_configs(self, configs):
         self._prior_config = None
-        self._dict = None
+        paths = set(map(str, configs))
+        self._prior_configs = {
+            path: prior_config
+            for path, prior_config in self._prior_configs.items()
+            if path in paths
+        }
+        self._layer_digests = {
+            path: digest
+            for path, digest in self._layer_digests.items()
+            if path in paths
+        }
+        if self._dict is not None and not self._update_layers(configs):
+            self._reset_dict()
         self._configs = configs
+        if self._dict is not None:
+            self._dict.paths[:] = self.paths
+        self._next_generation()
+
+    def _update_layers(self, configs) -> bool:
+        """
+        Add and remove layers in the merged config dictionary so it reflects a new
+        list of configs.
+
+        Returns
+        -------
+        False if the dictionary cannot be updated in place, because it was loaded
+        from a snapshot or the remaining configs have been reordered.
+        """
+        old_configs = self._configs
+        layers = self._dict._layers
+        if len(layers) != len(old_configs) or any(
+            layer is not config for layer, config in zip(layers, old_configs)
+        ):
+            return False
+
+        def contains(configs_, config):
+            return any(config is other for other in configs_)
+
+        remaining = [config for config in old_configs if contains(configs, config)]
+        if remaining != [config for config in configs if contains(remaining, config)]:
+            return False
+
+        for index in reversed(range(len(old_configs))):
+            if not contains(configs, old_configs[index]):
+                self._dict.remove_layer(index)
+        for index, config in enumerate(configs):
+            if not contains(remaining, config):
+                self._dict.insert_layer(index, config)
+        return True
+
+    def reload(self, changes=None):
+        """
+        Pick up changes to configuration files without discarding configuration
+        which is unaffected. This is called by ConfigWatcher when it sees a file
+        change.
+
+        Parameters
+        ----------
+        changes
+            Pairs of the path of a config directory and the path of a changed file
+            relative to it, e.g. ("config", "text/label.ini"). An empty relative path
+            means the whole directory changed. If None every config directory is
+            reloaded.
+        """
+        with self.lock.write():
+            if changes is None:
+                changes = [(config.path, "") for config in self._configs]
+            configs = {str(config.path): config for config in self._configs}
+            for path, file in changes:
+                config = configs.get(str(path))
+                if not isinstance(config, RecursiveConfig):
+                    continue
+                if file:
+                    self._reload_file(config, file)
+                else:
+                    self._reload_config(config)
+                self._layer_digests.pop(str(config.path), None)
+            self._next_generation()
+
+    def _reload_config(self, config: RecursiveConfig):
+        self._prior_configs.pop(str(config.path), None)
+        self._set_configs(
+            [
+                RecursiveConfig(config.path) if other is config else other
+                for other in self._configs
+            ]
+        )
+
+    def _reload_file(self, config: RecursiveConfig, file: str):
+        parts = tuple(file.split("/"))
+        manifest = config.manifest
+        manifest.refresh()
+        for name in parts[:-1]:
+            manifest = manifest.child(name)
+            manifest.refresh()
+
+        if parts[0] == "priors":
+            self._prior_configs.pop(str(config.path), None)
+            self._prior_config = None
+            return
+        if self._dict is None:
+            return
+        if len(self._dict._layers) != len(self._configs) or any(
+            layer is not config for layer, config in zip(self._dict._layers, self._configs)
+        ):
+            self._reset_dict()
+            return
+        self._dict.invalidate(parts[:-1] + (parts[-1].split(".")[0],))
 
     def __getitem__(self, item):
         return self.dict[item]
 
+    def get(self, path: str, default=None):
+        """
+        Get a value using a dotted path through configuration.
+
+        e.g. instance.get("visualize.general.general.backend", default="default")
+
+        Results, including misses, are cached per path until configuration changes
+        so repeated calls are a single dictionary lookup.
+
+        Parameters
+        ----------
+        path
+            Keys separated by "."
+        default
+            The value returned if there is no configuration at the path
+
+        Returns
+        -------
+        The value at the path or the default
+        """
+        if _overrides.get():
+            value = self._resolve_path(path)
+            return default if value is NoValue else value
+        # The generation and its cache are read together so a value resolved for
+        # one generation is never stored in the cache of another
+        generation = self.generation
+        cache_generation, cache = self._path_cache
+        if cache_generation != generation:
+            cache = dict()
+            self._path_cache = (generation, cache)
+        try:
+            value = cache[path]
+        except KeyError:
+            value = self._resolve_path(path)
+            cache[path] = value
+        if value is NoValue:
+            return default
+        return value
+
+    @contextmanager
+    def override(self, *path: str, value):
+        """
+        Override a value in configuration for the scope of a with block.
+
+        The override is only seen by the current thread or asyncio task so
+        concurrent code can use different configuration while sharing the same
+        parsed files.
+
+        e.g.
+        with instance.override("general", "output", "identifier_version", value=9):
+            ...
+
+        Parameters
+        ----------
+        path
+            A path through config. e.g. "general", "output", "identifier_version"
+        value
+            The value to use for the config field
+        """
+        key = (self, tuple(string.lower() for string in path))
+        token = _overrides.set({**_overrides.get(), key: value})
+        self._next_generation()
+        try:
+            yield
+        finally:
+            _overrides.reset(token)
+            self._next_generation()
+
+    @property
+    def output_path(self):
+        """
+        The path where data should be saved. This may be overridden for the current
+        thread or asyncio task with override_output_path.
+        """
+        return _output_path_overrides.get().get(self, self._output_path)
+
+    @output_path.setter
+    def output_path(self, output_path):
+        self._output_path = output_path
+
+    @contextmanager
+    def override_output_path(self, output_path: Union[str, Path]):
+        """
+        Override the output path for the current thread or asyncio task for the
+        scope of a with block.
+
+        Parameters
+        ----------
+        output_path
+            The path where data should be saved
+        """
+        token = _output_path_overrides.set(
+            {**_output_path_overrides.get(), self: output_path}
+        )
+        try:
+            yield
+        finally:
+            _output_path_overrides.reset(token)
+
+    def _resolve_path(self, path: str):
+        """
+        Find the value at a dotted path or NoValue if there is none.
+        """
+        value = self.dict
+        for key in _compile_path(path):
+            if not isinstance(value, DictWrapper):
+                return NoValue
+            value = value.lookup(key)
+            if value is NoValue:
+                return NoValue
+        return value
+
     def __iter__(self):
         return iter(self.dict)
 
@@ -203,10 +934,51 @@ class Config:
         """
         if self._prior_config is None:
             self._prior_config = PriorConfigWrapper(
-                [JSONPriorConfig.from_directory(path / "priors") for path in self.paths]
+                [self._prior_config_for(config) for config in self.configs]
             )
         return self._prior_config
 
+    def _prior_config_for(self, config: AbstractConfig) -> JSONPriorConfig:
+        """
+        Prior configuration for one config directory. This is loaded once and kept
+        while the directory remains one of the configs.
+        """
+        if isinstance(config, DictLayer):
+            return JSONPriorConfig(config.priors, directory=config.path)
+        try:
+            return self._prior_configs[str(config.path)]
+        except KeyError:
+            prior_config = JSONPriorConfig.from_manifest(
+                config.manifest.child("priors"), directory=config.path / "priors"
+            )
+            self._prior_configs[str(config.path)] = prior_config
+            return prior_config
+
+    def freeze(self) -> FrozenConfig:
+        """
+        Create an immutable, picklable copy of the merged configuration and prior
+        configuration.
+
+        The copy holds only plain dictionaries so it is cheap to send to worker
+        processes, e.g. in a ProcessPoolExecutor initializer, or to place in shared
+        memory with FrozenConfig.to_shared_memory.
+
+        Overrides active in the current context, including an overridden output
+        path, are applied to the copy.
+        """
+        prior_config = PriorConfigWrapper(
+            [
+                JSONPriorConfig(prior_config.obj, directory=prior_config.directory)
+                for prior_config in self.prior_config.prior_configs
+            ]
+        )
+        return FrozenConfig(
+            self.dict.dict(),
+            paths=self.paths,
+            output_path=self.output_path,
+            prior_config=prior_config,
+        )
+
     def push(
         self,
         new_path: Union[str, Path],
@@ -236,26 +1008,20 @@ class Config:
         """
         logger.debug(f"Pushing new config with path {new_path}")
 
-        if not Path(new_path).exists():
-            raise ConfigException(f"{new_path} does not exist")
+        new_config = RecursiveConfig(new_path)
 
-        CONFIG_SUFFIXES = (".yml", ".ini", ".json", ".yaml")
+        if not new_config.manifest.exists:
+            raise ConfigException(f"{new_path} does not exist")
 
-        has_config = False
-        for dirpath, _, files in os.walk(new_path):
-            for file in files:
-                if file.endswith(CONFIG_SUFFIXES):
-                    has_config = True
-                    break
-            if has_config:
-                break
+        suffixes = config_suffixes()
 
-        if not has_config:
+        if not new_config.manifest.has_files(suffixes):
             raise ConfigException(
-                f"{new_path} does not contain any files ending with {'/'.join(CONFIG_SUFFIXES)} recursively"
+                f"{new_path} does not contain any files ending with {'/'.join(suffixes)} recursively"
             )
 
-        self.output_path = output_path or self.output_path
+        if output_path is not None:
+            self._output_path = output_path
 
         try:
             if self.configs[0] == new_path or (
@@ -265,16 +1031,47 @@ class Config:
         except IndexError:
             pass
 
-        new_config = RecursiveConfig(new_path)
+        self._insert_config(new_config, keep_first)
+
+        self.configure_logging()
+
+    def push_dict(
+        self,
+        d: dict,
+        name: Optional[str] = None,
+        keep_first: bool = False,
+    ):
+        """
+        Push a layer of configuration held in memory. This takes part in priority
+        ordering, family lookup and prior lookup like a config directory but
+        needs no files.
+
+        e.g. instance.push_dict({"general": {"hpc": {"hpc_mode": True}}})
+
+        Parameters
+        ----------
+        d
+            Nested dictionaries of configuration keyed by file, section and key, in
+            the same structure as a config directory. Priors may be given under a
+            "priors" key keyed by module path. The dictionary is not copied.
+        name
+            A name for the layer. Pushing a layer with the name of an existing layer
+            replaces it. A unique name is generated if None.
+        keep_first
+            If True the current priority configuration mains such.
+        """
+        if name is None:
+            name = f"<dict {next(_dict_layer_count)}>"
+        logger.debug(f"Pushing dict config with name {name}")
+        self._insert_config(DictLayer(d, name), keep_first)
 
+    def _insert_config(self, new_config: AbstractConfig, keep_first: bool):
         configs = list(filter(lambda config: config != new_config, self.configs))
         if keep_first:
             self.configs = configs[:1] + [new_config] + configs[1:]
         else:
             self.configs = [new_config] + configs
 
-        self.configure_logging()
-
     def register(self, file: str):
         """
         Add defaults for a given project
@@ -322,13 +1119,9 @@ def output_path_for_test(temporary_path="temp", remove=True):
         @wraps(func)
         def wrapper(*args, **kwargs):
             remove_()
-            original_path = instance.output_path
-            instance.output_path = temporary_path
-
-            result = func(*args, **kwargs)
-
+            with instance.override_output_path(temporary_path):
+                result = func(*args, **kwargs)
             remove_()
-            instance.output_path = original_path
 
             return result
 
@@ -337,15 +1130,14 @@ def output_path_for_test(temporary_path="temp", remove=True):
     return decorator
 
 
-class NoValue:
-    pass
-
-
 def with_config(*path: str, value):
     """
     Create a decorator that swaps a value in configuration
     defined by path for the scope of a test.
 
+    The value is only swapped for the thread or asyncio task calling the
+    decorated function.
+
     Parameters
     ----------
     path
@@ -361,25 +1153,8 @@ def with_config(*path: str, value):
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            config = instance
-            for string in path[:-1]:
-                config = config[string]
-
-            try:
-                original_value = config[path[-1]]
-            except KeyError:
-                original_value = NoValue
-
-            config[path[-1]] = value
-
-            result = func(*args, **kwargs)
-
-            if original_value is NoValue:
-                del config[path[-1]]
-            else:
-                config[path[-1]] = original_value
-
-            return result
+            with instance.override(*path, value=value):
+                return func(*args, **kwargs)
 
         return wrapper
 
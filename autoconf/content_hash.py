@@ -0,0 +1,64 @@
+import hashlib
+import json
+import threading
+from typing import Dict, Tuple
+
+from autoconf import parsers
+from autoconf.directory_config import DirectoryManifest, config_suffixes
+
+# Digests of file contents keyed by path, each with the modification time and size
+# of the file when it was read
+_file_digests: Dict[str, Tuple[Tuple[int, int], bytes]] = dict()
+_lock = threading.Lock()
+
+
+def file_digest(manifest: DirectoryManifest, path: str, entry) -> bytes:
+    """
+    A digest of the contents of a file. Files are only read again if their
+    modification time or size has changed.
+
+    Parameters
+    ----------
+    manifest
+        The manifest of the directory containing the file
+    path
+        The path of the file relative to the directory
+    entry
+        The entry for the file from the manifest
+    """
+    key = f"{manifest.path}/{path}"
+    stat = entry.stat()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    with _lock:
+        cached = _file_digests.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    with parsers.open_binary(manifest.file(path)) as f:
+        digest = hashlib.blake2b(f.read(), digest_size=16).digest()
+    with _lock:
+        _file_digests[key] = (stamp, digest)
+    return digest
+
+
+def layer_digest(manifest: DirectoryManifest) -> str:
+    """
+    A digest of the contents of every config and prior file in a config directory.
+
+    The digest depends on file contents and relative paths only, so it is the same
+    for copies of a directory in different places or in a zip archive.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for path, entry in sorted(manifest.files(config_suffixes())):
+        digest.update(path.encode())
+        digest.update(b"\0")
+        digest.update(file_digest(manifest, path, entry))
+    return digest.hexdigest()
+
+
+def dict_digest(d: dict) -> str:
+    """
+    A digest of configuration held in nested dictionaries.
+    """
+    text = json.dumps(d, sort_keys=True, default=repr)
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
@@ -1,40 +1,89 @@
 import configparser
 import os
 from abc import abstractmethod, ABC
+from collections.abc import Mapping
 from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
-import yaml
+import numpy as np
 
-from autoconf import exc
+from autoconf import exc, lazy_yaml, parsers
+from autoconf.archive import ArchiveIndex, ArchiveMember, archive_index, split_archive_path
+from autoconf.parse_cache import parse_cache
+
+
+class NoValue:
+    """
+    Returned by lookups when no value is found
+    """
 
 
 class AbstractConfig(ABC):
+    __slots__ = ("_key_list", "_family_misses")
+
     @abstractmethod
     def _getitem(self, item):
         pass
 
+    def lookup(self, item, default=NoValue):
+        """
+        Get a value without raising an exception if it is not present.
+
+        Parameters
+        ----------
+        item
+            The key of the value
+        default
+            Returned if there is no value for the key
+
+        Returns
+        -------
+        The value or the default
+        """
+        try:
+            return self[item]
+        except KeyError:
+            return default
+
     def __getitem__(self, item):
         if isinstance(item, int):
-            return self.items()[item]
+            key = self.key_list[item]
+            return key, self[key]
         return self._getitem(item)
 
+    @property
+    def key_list(self) -> list:
+        """
+        The keys as a list, computed once so positional access and len do not
+        need to load every value.
+        """
+        try:
+            return self._key_list
+        except AttributeError:
+            self._key_list = list(self.keys())
+            return self._key_list
+
     def items(self):
         return [(key, self[key]) for key in self.keys()]
 
     def __len__(self):
-        return len(self.items())
+        return len(self.key_list)
 
     @abstractmethod
     def keys(self):
         pass
 
     def family(self, cls):
-        for cls in family(cls):
-            key = cls.__name__
-            try:
-                return self[key]
-            except (KeyError, configparser.NoOptionError):
-                pass
+        try:
+            misses = self._family_misses
+        except AttributeError:
+            misses = self._family_misses = set()
+        if cls not in misses:
+            for item in family(cls):
+                value = self.lookup(item.__name__)
+                if value is not NoValue:
+                    return value
+            misses.add(cls)
         raise KeyError(f"No configuration found for {cls.__name__}")
 
     def dict(self):
@@ -48,141 +97,521 @@ class AbstractConfig(ABC):
 
 
 class DictConfig(AbstractConfig):
+    __slots__ = ("d", "_children")
+
     def keys(self):
         return self.d.keys()
 
     def __init__(self, d):
+        """
+        Configuration held in nested dictionaries or other mappings.
+
+        Wrappers for nested dictionaries are created once and reused.
+
+        Parameters
+        ----------
+        d
+            The dictionary, which is shared and not modified
+        """
         self.d = d
+        self._children = dict()
 
-    def __getitem__(self, item):
-        value = self.d[item]
+    def _wrap(self, key, value):
         if isinstance(value, dict):
-            return DictConfig(value)
+            try:
+                return self._children[key]
+            except KeyError:
+                child = DictConfig(value)
+                self._children[key] = child
+                return child
         return value
 
+    def __getitem__(self, item):
+        return self._wrap(item, self.d[item])
+
     def _getitem(self, item):
         return self[item]
 
+    def lookup(self, item, default=NoValue):
+        try:
+            value = self.d.get(item, NoValue)
+        except TypeError:
+            return default
+        if value is NoValue:
+            return default
+        return self._wrap(item, value)
+
     def items(self):
         for key in self.d:
             yield key, self[key]
 
+    def __len__(self):
+        return len(self.d)
+
+    def dict(self):
+        """
+        A copy of the underlying dictionary, which is shared by every config
+        loaded from the same file.
+        """
+        return _copy(self.d)
+
+
+def _copy(value):
+    """
+    Copy parsed configuration, sharing only values other than mappings and lists.
+    """
+    if isinstance(value, Mapping):
+        return {key: _copy(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy(item) for item in value]
+    return value
+
+
+def _coerce(value: str):
+    """
+    Convert a string from an INI file to a bool, None, int or float where it
+    represents one.
+    """
+    lower = value.lower()
+    if lower == "true":
+        return True
+    if lower == "false":
+        return False
+    if lower in ("none", "null"):
+        return None
+    if value.isdigit():
+        return int(value)
+    try:
+        return float(value)
+    except ValueError:
+        return value
+
+
+class IniSection:
+    __slots__ = ("values", "lower_keys")
+
+    def __init__(self, values: dict):
+        """
+        The typed values of one section of an INI file.
+
+        Parameters
+        ----------
+        values
+            Values keyed by option name with the case used in the file
+        """
+        self.values = values
+        self.lower_keys = {key.lower(): key for key in values}
+
+    def get(self, key: str, default=NoValue):
+        """
+        Get a value by case-insensitive option name.
+        """
+        try:
+            return self.values[self.lower_keys[key.lower()]]
+        except KeyError:
+            return default
+
+
+def _load_ini_parser(path, preserve_case: bool = False) -> configparser.ConfigParser:
+    parser = configparser.ConfigParser()
+    if preserve_case:
+        parser.optionxform = str
+    with parsers.open_binary(path) as f:
+        parser.read_string(f.read().decode("utf-8"), source=str(path))
+    return parser
+
+
+def _load_ini(path) -> Dict[str, IniSection]:
+    """
+    Parse an INI file into typed values for each section. Values are converted
+    once here rather than on every access.
+    """
+    parser = _load_ini_parser(path, preserve_case=True)
+    sections = dict()
+    for section in parser.sections():
+        values = dict()
+        for key in parser.options(section):
+            try:
+                value = parser.get(section, key)
+            except configparser.InterpolationError:
+                value = parser.get(section, key, raw=True)
+            values[key] = _coerce(value)
+        sections[section] = IniSection(values)
+    return sections
+
 
 class YAMLConfig(AbstractConfig):
-    def __init__(self, path):
-        with open(path) as f:
-            self._dict = yaml.safe_load(f)
+    __slots__ = ("_dict", "_root")
+
+    def __init__(self, path, parser=parsers.load_yaml):
+        """
+        Configuration loaded from a YAML file or any other file which is parsed into
+        nested dictionaries, such as JSON or TOML.
+
+        Large YAML files in config directories are loaded with
+        lazy_yaml.load_yaml, which only parses top level sections when they are
+        accessed.
+
+        Parameters
+        ----------
+        path
+            The path to the file
+        parser
+            A function which parses the file. Defaults to the fastest available
+            YAML loader.
+        """
+        self._dict = parse_cache.load(path, parser)
+        self._root = DictConfig(self._dict if isinstance(self._dict, Mapping) else {})
 
     def _getitem(self, item):
-        value = self._dict[item]
-        if isinstance(value, dict):
-            return DictConfig(value)
-        return value
+        return self._root[item]
+
+    def lookup(self, item, default=NoValue):
+        return self._root.lookup(item, default)
 
     def keys(self):
-        if not isinstance(self._dict, dict):
-            return iter(())
-        return self._dict.keys()
+        return self._root.keys()
+
+    def __len__(self):
+        return len(self._root)
+
+    def dict(self):
+        return self._root.dict()
 
 
 class SectionConfig(AbstractConfig):
-    def __init__(self, path, parser, section):
+    __slots__ = ("path", "section", "values")
+
+    def __init__(self, path, values: IniSection, section):
+        """
+        A section of an INI file.
+
+        Parameters
+        ----------
+        path
+            The path to the file
+        values
+            The typed values in the section
+        section
+            The name of the section
+        """
         self.path = path
         self.section = section
-        self.parser = parser
+        self.values = values
 
     def keys(self):
-        with open(self.path) as f:
-            string = f.read()
-
-        lines = string.split("\n")
-        is_section = False
-        for line in lines:
-            if line == f"[{self.section}]":
-                is_section = True
-                continue
-            if line.startswith("["):
-                is_section = False
-                continue
-            if is_section and "=" in line:
-                yield line.split("=")[0]
+        return self.values.values.keys()
+
+    def lookup(self, item, default=NoValue):
+        if not isinstance(item, str):
+            return default
+        return self.values.get(item, default)
 
     def _getitem(self, item):
-        try:
-            result = self.parser.get(self.section, item)
-            if result.lower() == "true":
-                return True
-            if result.lower() == "false":
-                return False
-            if result.lower() in ("none", "null"):
-                return None
-            if result.isdigit():
-                return int(result)
-            try:
-                return float(result)
-            except ValueError:
-                return result
-        except (configparser.NoSectionError, configparser.NoOptionError):
+        value = self.lookup(item)
+        if value is NoValue:
             raise KeyError(f"No configuration found for {item} at path {self.path}")
+        return value
 
 
 class NamedConfig(AbstractConfig):
+    __slots__ = ("path", "sections")
+
     def __init__(self, config_path):
         """
         Parses generic config
 
+        Each file is parsed once into typed values for each section which are
+        shared by every NamedConfig for the same file.
+
         Parameters
         ----------
         config_path
             The path to the config file
         """
         self.path = config_path
-        self.parser = configparser.ConfigParser()
-        self.parser.read(self.path)
+        try:
+            self.sections = parse_cache.load(self.path, _load_ini)
+        except FileNotFoundError:
+            self.sections = dict()
+
+    @property
+    def parser(self) -> configparser.ConfigParser:
+        """
+        A ConfigParser for the file. This parses the file again and is only kept
+        for compatibility.
+        """
+        try:
+            return _load_ini_parser(self.path)
+        except FileNotFoundError:
+            return configparser.ConfigParser()
 
     def keys(self):
-        return self.parser.sections()
+        return list(self.sections.keys())
 
     def _getitem(self, item):
         return SectionConfig(
             self.path,
-            self.parser,
+            self.sections.get(item) or IniSection(dict()),
             item,
         )
 
+    def lookup(self, item, default=NoValue):
+        if not isinstance(item, str) or item not in self.sections:
+            return default
+        return self._getitem(item)
+
+
+class DirectoryManifest:
+    __slots__ = ("path", "_entries", "_exists", "_children")
 
-class RecursiveConfig(AbstractConfig):
     def __init__(self, path):
+        """
+        The entries of a directory, read with a single os.scandir call when first
+        required and shared by everything that needs to know what a config
+        directory contains.
+
+        Manifests of subdirectories are created on demand and held so a directory
+        tree is only ever scanned once.
+
+        Parameters
+        ----------
+        path
+            The path to the directory
+        """
         self.path = Path(path)
-        self._listing = None
+        self._entries = None
+        self._exists = None
+        self._children = dict()
+
+    def __getstate__(self):
+        # Directory entries cannot be pickled so the directory is scanned again
+        return self.path
+
+    def __setstate__(self, path):
+        self.__init__(path)
 
     @property
-    def listing(self):
-        if self._listing is None:
+    def entries(self) -> Dict[str, os.DirEntry]:
+        """
+        The entries in the directory keyed by name. Each entry caches whether it is
+        a directory and the result of stat.
+        """
+        if self._entries is None:
             try:
-                self._listing = set(os.listdir(self.path))
+                with os.scandir(self.path) as it:
+                    self._entries = {entry.name: entry for entry in it}
+                self._exists = True
             except FileNotFoundError:
-                self._listing = set()
-        return self._listing
+                self._entries = dict()
+                self._exists = False
+            except NotADirectoryError:
+                self._entries = dict()
+                self._exists = True
+        return self._entries
 
-    def keys(self):
+    @property
+    def exists(self) -> bool:
+        """
+        Does anything exist at the path?
+        """
+        _ = self.entries
+        return self._exists
+
+    def __contains__(self, name):
+        return name in self.entries
+
+    def refresh(self):
+        """
+        Read the directory again the next time its entries are required.
+        Manifests of subdirectories are kept and refreshed separately.
+        """
+        self._entries = None
+        self._exists = None
+
+    def is_dir(self, name: str) -> bool:
+        """
+        Is the entry with the given name a directory?
+        """
+        entry = self.entries.get(name)
+        return entry is not None and entry.is_dir()
+
+    def child(self, name: str) -> "DirectoryManifest":
+        """
+        The manifest for the subdirectory with the given name.
+        """
         try:
-            return [
-                path.split(".")[0]
-                for path in self.listing
-                if all(
-                    [
-                        path != "priors",
-                        len(path.split(".")[0]) != 0,
-                        os.path.isdir(f"{self.path}/{path}")
-                        or path.endswith(".ini")
-                        or path.endswith(".yaml")
-                        or path.endswith(".yml"),
-                    ]
-                )
-            ]
-        except FileNotFoundError as e:
-            raise KeyError(f"No configuration found at {self.path}") from e
+            return self._children[name]
+        except KeyError:
+            child = DirectoryManifest(self.path / name)
+            self._children[name] = child
+            return child
+
+    def files(
+        self, suffixes: Tuple[str, ...], exclude: Tuple[str, ...] = ()
+    ) -> Iterator[Tuple[str, os.DirEntry]]:
+        """
+        Recursively find files with any of the given suffixes.
+
+        Parameters
+        ----------
+        suffixes
+            File suffixes, e.g. ".yaml"
+        exclude
+            Names of directories which should not be searched
+
+        Returns
+        -------
+        Tuples of the path of each file relative to this directory and its entry
+        """
+        for name, entry in self.entries.items():
+            if entry.is_dir():
+                if name in exclude:
+                    continue
+                for path, child_entry in self.child(name).files(suffixes, exclude):
+                    yield f"{name}/{path}", child_entry
+            elif name.endswith(suffixes):
+                yield name, entry
+
+    def has_files(self, suffixes: Tuple[str, ...]) -> bool:
+        """
+        Does this directory or any subdirectory contain a file with any of the
+        given suffixes?
+        """
+        for _ in self.files(suffixes):
+            return True
+        return False
+
+    def file(self, path: str) -> Path:
+        """
+        The file at a path relative to this directory, to be passed to a parser.
+        """
+        return self.path / path
+
+
+class ArchiveManifest(DirectoryManifest):
+    __slots__ = ("index", "inner")
+
+    def __init__(self, index: ArchiveIndex, inner: str = ""):
+        """
+        The entries of a directory in a zip archive. The archive is indexed once
+        when it is first read so no filesystem calls are made here.
+
+        Parameters
+        ----------
+        index
+            The archive
+        inner
+            The path of the directory within the archive, empty for its root
+        """
+        super().__init__(index.path / inner if inner else index.path)
+        self.index = index
+        self.inner = inner
+
+    def __getstate__(self):
+        return self.index, self.inner
+
+    def __setstate__(self, state):
+        self.__init__(*state)
+
+    @property
+    def entries(self):
+        if self._entries is None:
+            self._exists = self.inner in self.index.directories
+            self._entries = self.index.directories.get(self.inner, dict())
+        return self._entries
+
+    def child(self, name: str) -> "ArchiveManifest":
+        try:
+            return self._children[name]
+        except KeyError:
+            child = ArchiveManifest(
+                self.index, f"{self.inner}/{name}" if self.inner else name
+            )
+            self._children[name] = child
+            return child
+
+    def file(self, path: str) -> ArchiveMember:
+        return ArchiveMember(self.index, f"{self.inner}/{path}" if self.inner else path)
+
+
+def manifest_for_path(path: Union[str, Path]) -> DirectoryManifest:
+    """
+    A manifest for a directory, or for a directory in a zip archive if the path
+    passes through one, e.g. bundle.zip/priors.
+    """
+    split = split_archive_path(path)
+    if split is None:
+        return DirectoryManifest(path)
+    archive_path, inner = split
+    return ArchiveManifest(archive_index(archive_path), inner)
+
+
+# Suffixes of config files in order of priority when several files share a name
+_PRIORITY_SUFFIXES = (".ini", ".yml", ".yaml")
+
+
+def config_suffixes() -> Tuple[str, ...]:
+    """
+    Suffixes of files treated as config in config directories in order of
+    priority. INI and YAML files come first followed by any other format with a
+    registered parser.
+    """
+    return _PRIORITY_SUFFIXES + tuple(
+        suffix for suffix in parsers.suffixes() if suffix not in _PRIORITY_SUFFIXES
+    )
+
+
+def config_for_file(path: Union[Path, ArchiveMember]) -> AbstractConfig:
+    """
+    Load configuration from a file, or a member of a zip archive, using the
+    parser for its suffix.
+    """
+    if path.suffix == ".ini":
+        return NamedConfig(path)
+    parser = parsers.parser_for_suffix(path.suffix)
+    if parser is parsers.load_yaml:
+        parser = lazy_yaml.load_yaml
+    return YAMLConfig(path, parser)
+
+
+class RecursiveConfig(AbstractConfig):
+    __slots__ = ("path", "manifest")
+
+    def __init__(self, path, manifest: Optional[DirectoryManifest] = None):
+        """
+        Configuration loaded from a directory of config files and subdirectories.
+
+        The directory may be a zip archive or a directory within one, e.g.
+        config.zip or bundle.zip/config.
+
+        Parameters
+        ----------
+        path
+            The path to the directory
+        manifest
+            A manifest of the directory. If this is not passed one is created.
+        """
+        self.path = Path(path)
+        self.manifest = manifest or manifest_for_path(self.path)
+
+    @property
+    def listing(self):
+        return self.manifest.entries.keys()
+
+    def keys(self):
+        suffixes = config_suffixes()
+        return [
+            path.split(".")[0]
+            for path, entry in self.manifest.entries.items()
+            if all(
+                [
+                    path != "priors",
+                    len(path.split(".")[0]) != 0,
+                    path.endswith(suffixes) or entry.is_dir(),
+                ]
+            )
+        ]
 
     def __eq__(self, other):
         return str(self) == str(other)
@@ -193,32 +622,212 @@ class RecursiveConfig(AbstractConfig):
     def __repr__(self):
         return f"<{self.__class__.__name__} {self.path}>"
 
+    def _file_name(self, item: str) -> Optional[str]:
+        """
+        The name of the highest priority config file for an item, if there is one.
+        """
+        entries = self.manifest.entries
+        for suffix in config_suffixes():
+            name = f"{item}{suffix}"
+            if name in entries:
+                return name
+        return None
+
+    def lookup(self, item, default=NoValue):
+        if not isinstance(item, str):
+            return default
+        if self._file_name(item) is None and not self.manifest.is_dir(item):
+            return default
+        return self._getitem(item)
+
     def _getitem(self, item):
-        listing = self.listing
-        ini_name = f"{item}.ini"
-        if ini_name in listing:
-            return NamedConfig(self.path / ini_name)
-        yml_name = f"{item}.yml"
-        if yml_name in listing:
-            return YAMLConfig(self.path / yml_name)
-        yaml_name = f"{item}.yaml"
-        if yaml_name in listing:
-            return YAMLConfig(self.path / yaml_name)
-        if item in listing and os.path.isdir(self.path / item):
-            return RecursiveConfig(self.path / item)
+        name = self._file_name(item)
+        if name is not None:
+            return config_for_file(self.manifest.file(name))
+        if self.manifest.is_dir(item):
+            return RecursiveConfig(self.path / item, manifest=self.manifest.child(item))
         raise KeyError(f"No configuration found for {item} at path {self.path}")
 
 
+class DictLayer(DictConfig):
+    __slots__ = ("path",)
+
+    def __init__(self, d: dict, path: str):
+        """
+        A layer of configuration held in memory rather than in a directory.
+
+        Nested dictionaries take the place of files and sections. Priors may be
+        given under a top level "priors" key in the same form as a prior file,
+        keyed by module path.
+
+        Parameters
+        ----------
+        d
+            Nested dictionaries of configuration. This is not copied.
+        path
+            A name for the layer, used in error messages and to replace the layer
+            when one with the same name is pushed.
+        """
+        super().__init__(d)
+        self.path = path
+
+    @property
+    def priors(self) -> dict:
+        return self.d.get("priors") or dict()
+
+    def keys(self):
+        return [key for key in self.d if key != "priors"]
+
+    def __eq__(self, other):
+        return str(self) == str(other)
+
+    def __str__(self):
+        return str(self.path)
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {self.path}>"
+
+
+# Numeric fields of prior arrays and the keys through prior configuration to each
+_PRIOR_ARRAY_FIELDS = (
+    ("lower_limit", ("lower_limit",)),
+    ("upper_limit", ("upper_limit",)),
+    ("mean", ("mean",)),
+    ("sigma", ("sigma",)),
+    ("width_modifier_value", ("width_modifier", "value")),
+    ("limits_lower", ("limits", "lower")),
+    ("limits_upper", ("limits", "upper")),
+)
+
+
+def _prior_field(prior, keys: Tuple[str, ...]):
+    for key in keys:
+        if not isinstance(prior, dict):
+            return None
+        prior = prior.get(key)
+    return prior
+
+
 class PriorConfigWrapper:
+    __slots__ = ("prior_configs", "_cache")
+
     def __init__(self, prior_configs):
+        """
+        Prior configuration from every config directory in order of priority.
+
+        Results are cached by class and path, including failures to find
+        configuration. Config creates a new wrapper whenever its configs change
+        so the cache never outlives the configuration it was built from.
+
+        Parameters
+        ----------
+        prior_configs
+            A JSONPriorConfig for each config directory
+        """
         self.prior_configs = prior_configs
+        self._cache = dict()
+
+    def __getstate__(self):
+        return self.prior_configs
+
+    def __setstate__(self, prior_configs):
+        self.prior_configs = prior_configs
+        self._cache = dict()
+
+    def clear(self):
+        """
+        Discard cached results
+        """
+        self._cache = dict()
+
+    def lookup_for_class_and_suffix_path(self, cls, path, default=NoValue):
+        """
+        Get prior configuration for a class, or the first of its ancestors with
+        configuration, without raising an exception if there is none.
+
+        Parameters
+        ----------
+        cls
+            The class with which the prior is associated
+        path
+            The path to the prior, e.g. ["redshift"]
+        default
+            Returned if no configuration is found
+
+        Returns
+        -------
+        A configuration dictionary or the default
+        """
+        key = (cls, tuple(path))
+        try:
+            value = self._cache[key]
+        except KeyError:
+            value = NoValue
+            for config in self.prior_configs:
+                value = config.lookup_for_class_and_suffix_path(cls, path)
+                if value is not NoValue:
+                    break
+            self._cache[key] = value
+        if value is NoValue:
+            return default
+        return value
+
+    def arrays_for_classes_and_suffix_paths(
+        self, pairs: List[Tuple[type, List[str]]]
+    ) -> np.recarray:
+        """
+        Get prior configuration for many parameters at once as aligned arrays, e.g.
+        to vectorise unit cube transforms.
+
+        Parameters
+        ----------
+        pairs
+            A class and the path to a prior for each parameter, e.g.
+            [(Redshift, ["redshift"]), (Gaussian, ["sigma"])]
+
+        Returns
+        -------
+        A record array with one row per pair and the fields type,
+        width_modifier_type (strings), lower_limit, upper_limit, mean, sigma,
+        width_modifier_value, limits_lower and limits_upper (floats). Fields not
+        configured for a prior are NaN, or an empty string for string fields.
+        Index fields by name, e.g. arrays["mean"], as some field names are also
+        array methods.
+
+        Raises
+        ------
+        ConfigException
+            If there is no configuration for one of the pairs
+        """
+        priors = [self.for_class_and_suffix_path(cls, path) for cls, path in pairs]
+
+        strings = {
+            name: [str(_prior_field(prior, keys) or "") for prior in priors]
+            for name, keys in (
+                ("type", ("type",)),
+                ("width_modifier_type", ("width_modifier", "type")),
+            )
+        }
+        arrays = [
+            np.array(values, dtype=f"U{max(map(len, values), default=0) or 1}")
+            for values in strings.values()
+        ]
+        names = list(strings)
+        for name, keys in _PRIOR_ARRAY_FIELDS:
+            values = [_prior_field(prior, keys) for prior in priors]
+            arrays.append(
+                np.array(
+                    [np.nan if value is None else float(value) for value in values],
+                    dtype=np.float64,
+                )
+            )
+            names.append(name)
+        return np.rec.fromarrays(arrays, names=names)
 
     def for_class_and_suffix_path(self, cls, path):
-        for config in self.prior_configs:
-            try:
-                return config.for_class_and_suffix_path(cls, path)
-            except KeyError:
-                pass
+        value = self.lookup_for_class_and_suffix_path(cls, path)
+        if value is not NoValue:
+            return value
         directories = " ".join(str(config.directory) for config in self.prior_configs)
 
         print()
@@ -236,8 +845,12 @@ class PriorConfigWrapper:
         )
 
 
-def family(current_class):
-    yield current_class
-    for next_class in current_class.__bases__:
-        for val in family(next_class):
-            yield val
+def family(current_class) -> tuple:
+    """
+    A class followed by all of its ancestors in method resolution order, with each
+    class appearing once.
+
+    This is the class's __mro__, which Python computes once when the class is
+    created, so no work is repeated between calls.
+    """
+    return current_class.__mro__
@@ -4,3 +4,33 @@ class ConfigException(Exception):
 
 class PriorException(Exception):
     pass
+
+
+class MissingConfigError(KeyError):
+    def __init__(self, key, paths):
+        """
+        Raised when a key is not found in any config path.
+
+        The message is only formatted when the error is displayed so misses that
+        are caught and handled cost no more than a plain KeyError.
+        """
+        super().__init__(key)
+        self.key = key
+        self.paths = paths
+
+    def __reduce__(self):
+        return type(self), (self.key, self.paths)
+
+    def __str__(self):
+        paths_string = "\n".join(map(str, self.paths))
+        return f"key {self.key} not found in paths {paths_string}"
+
+
+class MissingFamilyError(MissingConfigError):
+    """
+    Raised when no configuration is found for a class or any of its parents.
+    """
+
+    def __str__(self):
+        paths_string = "\n".join(map(str, self.paths))
+        return f"config for {self.key} or its parents not found in paths {paths_string}"
@@ -0,0 +1,189 @@
+import pickle
+from collections.abc import Mapping
+from multiprocessing import resource_tracker, shared_memory
+from pathlib import Path
+from typing import List, Optional, Union
+
+from autoconf.directory_config import NoValue, PriorConfigWrapper, family
+from autoconf.exc import MissingConfigError
+
+# Number of bytes used to store the length of the pickled config in shared memory
+_HEADER_SIZE = 8
+
+
+class FrozenConfig(Mapping):
+    __slots__ = ("_tree", "paths", "output_path", "_prior_config")
+
+    def __init__(
+        self,
+        tree: dict,
+        paths: List[str] = (),
+        output_path: Optional[Union[str, Path]] = None,
+        prior_config: Optional[PriorConfigWrapper] = None,
+    ):
+        """
+        An immutable copy of configuration created with Config.freeze.
+
+        Configuration is held as plain nested dictionaries with lower case keys so
+        it can be pickled cheaply and sent to worker processes, which can then read
+        configuration without touching the filesystem.
+
+        Parameters
+        ----------
+        tree
+            Nested dictionaries of configuration
+        paths
+            The config paths the configuration was loaded from
+        output_path
+            The path where data should be saved
+        prior_config
+            Prior configuration for the config paths
+        """
+        self._tree = tree
+        self.paths = list(map(str, paths))
+        self.output_path = output_path
+        self._prior_config = prior_config
+
+    def __getstate__(self):
+        return self._tree, self.paths, self.output_path, self._prior_config
+
+    def __setstate__(self, state):
+        self._tree, self.paths, self.output_path, self._prior_config = state
+
+    def _wrap(self, value):
+        if isinstance(value, dict):
+            return FrozenConfig(value, self.paths)
+        return value
+
+    def lookup(self, key, default=NoValue):
+        """
+        Get a value without raising an exception if it is not present.
+        """
+        if isinstance(key, str):
+            key = key.lower()
+        try:
+            value = self._tree.get(key, NoValue)
+        except TypeError:
+            return default
+        if value is NoValue:
+            return default
+        return self._wrap(value)
+
+    def __getitem__(self, key):
+        value = self.lookup(key)
+        if value is NoValue:
+            raise MissingConfigError(key, self.paths)
+        return value
+
+    def __iter__(self):
+        return iter(self._tree)
+
+    def __len__(self):
+        return len(self._tree)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self._tree!r})"
+
+    def get(self, path: str, default=None):
+        """
+        Get a value using a dotted path through configuration.
+
+        Parameters
+        ----------
+        path
+            Keys separated by "."
+        default
+            The value returned if there is no configuration at the path
+        """
+        value = self._tree
+        for key in path.lower().split("."):
+            if not isinstance(value, dict):
+                return default
+            value = value.get(key, NoValue)
+            if value is NoValue:
+                return default
+        return self._wrap(value)
+
+    def family(self, cls):
+        """
+        Get configuration for a class or the first of its ancestors for which
+        there is configuration, keyed by class name.
+        """
+        for item in family(cls):
+            value = self.lookup(item.__name__)
+            if value is not NoValue:
+                return value
+        raise KeyError(
+            f"config for {cls} or its parents not found in paths {self.paths}"
+        )
+
+    def dict(self) -> dict:
+        """
+        The configuration as nested dictionaries
+        """
+        return self._tree
+
+    @property
+    def prior_config(self) -> PriorConfigWrapper:
+        """
+        Configuration for priors
+        """
+        if self._prior_config is None:
+            raise KeyError("No prior configuration was frozen with this config")
+        return self._prior_config
+
+    def to_shared_memory(
+        self, name: Optional[str] = None
+    ) -> shared_memory.SharedMemory:
+        """
+        Place a pickled copy of this config in a shared memory block so worker
+        processes can load it with FrozenConfig.from_shared_memory instead of
+        receiving a copy each.
+
+        The caller owns the returned block and should call close and unlink on it
+        once workers have finished.
+
+        Parameters
+        ----------
+        name
+            The name of the block. A unique name is generated if this is None.
+
+        Returns
+        -------
+        The shared memory block. Its name is passed to workers.
+        """
+        data = pickle.dumps(self, protocol=pickle.HIGHEST_PROTOCOL)
+        block = shared_memory.SharedMemory(
+            name=name, create=True, size=_HEADER_SIZE + len(data)
+        )
+        block.buf[:_HEADER_SIZE] = len(data).to_bytes(_HEADER_SIZE, "little")
+        block.buf[_HEADER_SIZE : _HEADER_SIZE + len(data)] = data
+        return block
+
+    @classmethod
+    def from_shared_memory(cls, name: str) -> "FrozenConfig":
+        """
+        Load a config placed in shared memory with to_shared_memory.
+
+        Parameters
+        ----------
+        name
+            The name of the shared memory block
+        """
+        try:
+            block = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            # Before Python 3.13 attaching registers the block with the resource
+            # tracker. Worker processes share the tracker of the process which
+            # started them, where registering again is harmless. A process with no
+            # tracker starts its own, which would unlink the block when the process
+            # exits, so the block is unregistered from it.
+            own_tracker = getattr(resource_tracker._resource_tracker, "_fd", 0) is None
+            block = shared_memory.SharedMemory(name=name)
+            if own_tracker and getattr(shared_memory, "_USE_POSIX", False):
+                resource_tracker.unregister(block._name, "shared_memory")
+        try:
+            size = int.from_bytes(block.buf[:_HEADER_SIZE], "little")
+            return pickle.loads(block.buf[_HEADER_SIZE : _HEADER_SIZE + size])
+        finally:
+            block.close()
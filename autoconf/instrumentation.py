@@ -0,0 +1,261 @@
+"""
+Opt-in instrumentation of configuration loading and lookup.
+
+When enabled the methods listed in ``_TARGETS`` are replaced with wrappers which
+count calls and misses and accumulate time spent. When disabled the original
+methods are restored so there is no overhead at all.
+
+Enable by setting the environment variable PYAUTO_CONFIG_INSTRUMENT=1 or calling
+``instrumentation.enable()``. If PYAUTO_CONFIG_INSTRUMENT_OUTPUT is set to a path
+ending in .json or .csv the report is written there when the process exits.
+"""
+import atexit
+import csv
+import functools
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Optional, Union
+
+from autoconf.conf import Config, DictWrapper
+from autoconf.directory_config import (
+    NamedConfig,
+    NoValue,
+    PriorConfigWrapper,
+    RecursiveConfig,
+    YAMLConfig,
+)
+from autoconf.parse_cache import ParseCache, parse_cache
+
+INSTRUMENT_ENVIRONMENT_VARIABLE = "PYAUTO_CONFIG_INSTRUMENT"
+OUTPUT_ENVIRONMENT_VARIABLE = "PYAUTO_CONFIG_INSTRUMENT_OUTPUT"
+
+# (class, method name, operation name)
+_TARGETS = (
+    (Config, "__getitem__", "Config.__getitem__"),
+    (Config, "get", "Config.get"),
+    (RecursiveConfig, "_getitem", "RecursiveConfig._getitem"),
+    (YAMLConfig, "__init__", "YAMLConfig.__init__"),
+    (NamedConfig, "__init__", "NamedConfig.__init__"),
+    (
+        PriorConfigWrapper,
+        "for_class_and_suffix_path",
+        "PriorConfigWrapper.for_class_and_suffix_path",
+    ),
+)
+
+
+class _Statistic:
+    __slots__ = ("count", "misses", "total_seconds")
+
+    def __init__(self):
+        self.count = 0
+        self.misses = 0
+        self.total_seconds = 0.0
+
+    def dict(self) -> dict:
+        return {
+            "count": self.count,
+            "misses": self.misses,
+            "total_seconds": self.total_seconds,
+            "mean_seconds": self.total_seconds / self.count if self.count else 0.0,
+        }
+
+
+class Instrumentation:
+    def __init__(self):
+        """
+        Records how often configuration is parsed and looked up and how long it
+        takes.
+        """
+        self.enabled = False
+        self._originals = dict()
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """
+        Discard everything recorded so far.
+        """
+        self.operations = defaultdict(_Statistic)
+        self.key_paths = defaultdict(_Statistic)
+        self.parses = defaultdict(int)
+        self.lookup_cache_hits = 0
+        self._parse_cache_baseline = (parse_cache.hits, parse_cache.misses)
+
+    def _record(self, statistics, name, seconds=0.0, miss=False):
+        with self._lock:
+            statistic = statistics[name]
+            statistic.count += 1
+            statistic.total_seconds += seconds
+            if miss:
+                statistic.misses += 1
+
+    def _timed(self, name, func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            miss = False
+            try:
+                return func(*args, **kwargs)
+            except Exception:
+                miss = True
+                raise
+            finally:
+                self._record(
+                    self.operations, name, time.perf_counter() - start, miss=miss
+                )
+
+        return wrapper
+
+    def _wrap_lookup(self, func):
+        @functools.wraps(func)
+        def lookup(wrapper, key, default=NoValue):
+            if isinstance(key, str):
+                key = key.lower()
+            if key in wrapper._dict:
+                with self._lock:
+                    self.lookup_cache_hits += 1
+            start = time.perf_counter()
+            value = func(wrapper, key, NoValue)
+            seconds = time.perf_counter() - start
+            miss = value is NoValue
+            self._record(self.operations, "DictWrapper.lookup", seconds, miss=miss)
+            if isinstance(key, str):
+                key_path = ".".join(wrapper.key_path + (key,))
+                self._record(self.key_paths, key_path, seconds, miss=miss)
+            return default if miss else value
+
+        return lookup
+
+    def _wrap_load(self, func):
+        @functools.wraps(func)
+        def load(cache, path, parser):
+            misses = cache.misses
+            start = time.perf_counter()
+            try:
+                return func(cache, path, parser)
+            finally:
+                self._record(
+                    self.operations, "ParseCache.load", time.perf_counter() - start
+                )
+                if cache.misses != misses:
+                    with self._lock:
+                        self.parses[str(path)] += 1
+
+        return load
+
+    def enable(self):
+        """
+        Start recording. Methods are wrapped so calls are counted and timed.
+        """
+        if self.enabled:
+            return
+        for cls, name, operation in _TARGETS:
+            original = cls.__dict__[name]
+            self._originals[(cls, name)] = original
+            setattr(cls, name, self._timed(operation, original))
+        for cls, name, wrap in (
+            (DictWrapper, "lookup", self._wrap_lookup),
+            (ParseCache, "load", self._wrap_load),
+        ):
+            original = cls.__dict__[name]
+            self._originals[(cls, name)] = original
+            setattr(cls, name, wrap(original))
+        self.enabled = True
+
+    def disable(self):
+        """
+        Stop recording and restore the original methods. Recorded statistics are
+        kept until reset is called.
+        """
+        for (cls, name), original in self._originals.items():
+            setattr(cls, name, original)
+        self._originals = dict()
+        self.enabled = False
+
+    def report(self) -> dict:
+        """
+        Everything recorded as a dictionary which can be serialised to JSON.
+        """
+        hits = parse_cache.hits - self._parse_cache_baseline[0]
+        misses = parse_cache.misses - self._parse_cache_baseline[1]
+        lookup = self.operations.get("DictWrapper.lookup")
+        lookups = 0 if lookup is None else lookup.count
+        return {
+            "operations": {
+                name: statistic.dict() for name, statistic in self.operations.items()
+            },
+            "key_paths": {
+                name: statistic.dict() for name, statistic in self.key_paths.items()
+            },
+            "parses": dict(self.parses),
+            "parse_cache": {
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+            },
+            "lookup_cache": {
+                "lookups": lookups,
+                "hits": self.lookup_cache_hits,
+                "hit_rate": self.lookup_cache_hits / lookups if lookups else 0.0,
+            },
+        }
+
+    def to_json(self, path: Optional[Union[str, Path]] = None) -> str:
+        """
+        The report as JSON, optionally written to a file.
+        """
+        string = json.dumps(self.report(), indent=4)
+        if path is not None:
+            with open(path, "w") as f:
+                f.write(string)
+        return string
+
+    def to_csv(self, path: Union[str, Path]):
+        """
+        Write operation, key path and parse statistics to a CSV file with one row
+        per name.
+        """
+        report = self.report()
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(
+                ["section", "name", "count", "misses", "total_seconds", "mean_seconds"]
+            )
+            for section in ("operations", "key_paths"):
+                for name, statistic in report[section].items():
+                    writer.writerow(
+                        [
+                            section,
+                            name,
+                            statistic["count"],
+                            statistic["misses"],
+                            statistic["total_seconds"],
+                            statistic["mean_seconds"],
+                        ]
+                    )
+            for name, count in report["parses"].items():
+                writer.writerow(["parses", name, count, 0, "", ""])
+
+    def dump(self, path: Union[str, Path]):
+        """
+        Write the report to a .json or .csv file depending on its suffix.
+        """
+        if str(path).endswith(".csv"):
+            self.to_csv(path)
+        else:
+            self.to_json(path)
+
+
+instrumentation = Instrumentation()
+
+if os.environ.get(INSTRUMENT_ENVIRONMENT_VARIABLE, "0") not in ("", "0"):
+    instrumentation.enable()
+
+    _output_path = os.environ.get(OUTPUT_ENVIRONMENT_VARIABLE)
+    if _output_path:
+        atexit.register(instrumentation.dump, _output_path)
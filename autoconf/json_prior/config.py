@@ -1,13 +1,18 @@
 import inspect
 import json
 import logging
-from collections.abc import Sized
-from pathlib import Path
-from typing import List, Type, Tuple
-
-import yaml
-
-from autoconf.directory_config import family
+import sys
+import threading
+from collections.abc import Mapping, Sized
+from typing import Callable, Dict, Iterator, List, Optional, Type, Tuple
+
+from autoconf import parsers
+from autoconf.directory_config import (
+    DirectoryManifest,
+    family,
+    manifest_for_path,
+    NoValue,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -55,8 +60,123 @@ def path_for_class(cls) -> List[str]:
     return f"{cls.__module__}.{cls.__name__}".split(".")
 
 
+class PathNode:
+    __slots__ = ("children", "value")
+
+    def __init__(self):
+        """
+        A node in a trie of dotted paths through prior configuration, keyed by
+        interned path components. Each path is stored once however it is split
+        between files, nested dictionaries and dotted keys, so the trie grows
+        linearly with the configuration.
+
+        Nodes without children hold None rather than an empty dictionary.
+        """
+        self.children = None
+        self.value = NoValue
+
+    def child(self, component: str) -> "PathNode":
+        """
+        The child for a component, created if it does not exist.
+        """
+        if self.children is None:
+            self.children = dict()
+        try:
+            return self.children[component]
+        except KeyError:
+            node = PathNode()
+            self.children[sys.intern(component)] = node
+            return node
+
+    def insert(self, obj: dict):
+        """
+        Add every path through nested dictionaries below this node. Keys may contain
+        dots, which separate path components.
+        """
+        for key, value in obj.items():
+            node = self
+            for component in key.split("."):
+                node = node.child(component)
+            node.value = value
+            if isinstance(value, dict):
+                node.insert(value)
+
+    def find(self, components) -> "Optional[PathNode]":
+        node = self
+        for component in components:
+            if node.children is None:
+                return None
+            node = node.children.get(component)
+            if node is None:
+                return None
+        return node
+
+    def longest_suffix(self, components: List[str]):
+        """
+        The value for the longest path in the trie which matches the end of a
+        path component by component, or NoValue if there is none.
+
+        Only positions where the component starts a path in the trie are tried.
+        """
+        children = self.children
+        if children is None:
+            return NoValue
+        for i, component in enumerate(components):
+            node = children.get(component)
+            if node is None:
+                continue
+            node = node.find(components[i + 1 :])
+            if node is not None and node.value is not NoValue:
+                return node.value
+        return NoValue
+
+    def items(self, prefix: str = "") -> Iterator[Tuple[str, object]]:
+        """
+        Every dotted path with a value below this node and that value, depth first
+        in the order paths were added.
+        """
+        if self.children is None:
+            return
+        for component, node in self.children.items():
+            path = f"{prefix}{component}"
+            if node.value is not NoValue:
+                yield path, node.value
+            yield from node.items(f"{path}.")
+
+
+class PathValueMap(Mapping):
+    __slots__ = ("root",)
+
+    def __init__(self, root: PathNode):
+        """
+        A read-only view of a path trie as a dictionary from dotted paths to
+        configuration. Paths are generated as they are iterated rather than stored.
+        """
+        self.root = root
+
+    def __getitem__(self, path: str):
+        node = self.root.find(path.split("."))
+        if node is None or node.value is NoValue:
+            raise KeyError(path)
+        return node.value
+
+    def __iter__(self):
+        return (path for path, _ in self.root.items())
+
+    def __len__(self):
+        return sum(1 for _ in self.root.items())
+
+    def items(self):
+        return self.root.items()
+
+
 class JSONPriorConfig:
-    def __init__(self, config_dict: dict, directory=None):
+    def __init__(
+        self,
+        config_dict: dict,
+        directory=None,
+        pending: Optional[Dict[str, Tuple[Callable, object]]] = None,
+    ):
         """
         Parses configuration describing priors associated with classes.
 
@@ -75,34 +195,99 @@ class JSONPriorConfig:
         config_dict
             A dictionary describing the prior configuration for constructor arguments
             of different classes.
+        directory
+            The directory the configuration was loaded from, used in error messages
+        pending
+            Files which have not been parsed yet, keyed by the dotted module path
+            their configuration is placed under, with the parser for each. A file
+            is parsed the first time a path containing its module path is looked up.
         """
-        self.obj = config_dict
+        self._obj = config_dict
         self.directory = directory
-        self._path_value_map = None
+        self._pending = dict(pending or {})
+        self._pending_index = dict()
+        for key in self._pending:
+            components = tuple(key.split("."))
+            self._pending_index.setdefault(components[0], []).append((components, key))
+        self._trie = None
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
 
     @property
-    def paths(self):
-        return list(self.path_value_map.keys())
+    def obj(self) -> dict:
+        """
+        The prior configuration, parsing any files which have not been parsed yet.
+        """
+        self._load_all()
+        return self._obj
 
-    @property
-    def path_value_map(self) -> dict:
+    def _load(self, key: str):
+        # A file stays pending until its configuration is in the trie so a lookup
+        # in another thread waits for it rather than missing it
+        with self._lock:
+            try:
+                parser, file = self._pending[key]
+            except KeyError:
+                return
+            value = parser(file)
+            self._obj[key] = value
+            if self._trie is not None:
+                self._trie.insert({key: value})
+            del self._pending[key]
+
+    def _load_all(self):
+        for key in list(self._pending):
+            self._load(key)
+
+    def _load_for(self, components: List[str]):
         """
-        A dictionary matching every possible path to the configuration it points to.
+        Parse every pending file whose module path appears in a path.
         """
-        if self._path_value_map is None:
+        for i, component in enumerate(components):
+            for key_components, key in self._pending_index.get(component, ()):
+                if (
+                    key in self._pending
+                    and tuple(components[i : i + len(key_components)])
+                    == key_components
+                ):
+                    self._load(key)
 
-            def get_path_values(obj):
-                path_values = dict()
-                if isinstance(obj, dict):
-                    for key, value in obj.items():
-                        path_values[key] = value
-                        for path, path_value in get_path_values(value).items():
-                            path_values[f"{key}.{path}"] = path_value
+    @property
+    def paths(self) -> Iterator[str]:
+        """
+        Every possible path through the configuration, generated lazily.
+        """
+        return iter(self.path_value_map)
 
-                return path_values
+    @property
+    def path_value_map(self) -> PathValueMap:
+        """
+        A mapping from every possible path to the configuration it points to.
+        """
+        self._load_all()
+        return PathValueMap(self.trie)
 
-            self._path_value_map = get_path_values(self.obj)
-        return self._path_value_map
+    @property
+    def trie(self) -> PathNode:
+        """
+        Every path through the files parsed so far. This is built once and
+        extended as files are parsed.
+        """
+        if self._trie is None:
+            with self._lock:
+                if self._trie is None:
+                    trie = PathNode()
+                    trie.insert(self._obj)
+                    self._trie = trie
+        return self._trie
 
     @property
     def path_value_tuples(self) -> List[Tuple[str, object]]:
@@ -117,34 +302,65 @@ class JSONPriorConfig:
         )
 
     @classmethod
-    def from_directory(cls, directory: str) -> "JSONPriorConfig":
+    def from_directory(cls, directory: str, lazy: bool = True) -> "JSONPriorConfig":
         """
-        Load JSONPriorConfiguration from a file.
+        Load JSONPriorConfiguration from a directory of files in any format with
+        a registered parser (JSON, YAML and TOML by default).
 
         Parameters
         ----------
         directory
-            The path to a file.
+            The path to a directory. This may be a zip archive or a directory
+            within one, e.g. bundle.zip/priors.
+        lazy
+            If True files are only parsed when a class from their module is first
+            looked up. Otherwise every file is parsed now.
 
         Returns
         -------
         A configuration instance.
         """
-        config_dict = dict()
+        return cls.from_manifest(
+            manifest_for_path(directory), directory=directory, lazy=lazy
+        )
 
-        config_path = Path(directory)
+    @classmethod
+    def from_manifest(
+        cls, manifest: DirectoryManifest, directory=None, lazy: bool = True
+    ) -> "JSONPriorConfig":
+        """
+        Load JSONPriorConfiguration from the files listed in a directory manifest.
 
-        for suffix, parser in [
-            ("json", json.load),
-            ("yaml", yaml.safe_load),
-            ("yml", yaml.safe_load),
-        ]:
-            for file in config_path.rglob(f"*.{suffix}"):
-                parts = file.relative_to(config_path).with_suffix("").parts
-                with open(file) as f:
-                    config_dict[".".join(parts)] = parser(f)
+        Parameters
+        ----------
+        manifest
+            A manifest of the priors directory
+        directory
+            The path to the directory, used in error messages
+        lazy
+            If True files are only parsed when a class from their module is first
+            looked up. Otherwise every file is parsed now.
 
-        return JSONPriorConfig(config_dict, directory=directory)
+        Returns
+        -------
+        A configuration instance.
+        """
+        pending = dict()
+
+        for suffix in parsers.suffixes():
+            parser = parsers.parser_for_suffix(suffix)
+            for path, _ in manifest.files((suffix,)):
+                key = path[: -len(suffix)].replace("/", ".")
+                pending[key] = (parser, manifest.file(path))
+
+        config = JSONPriorConfig(
+            dict(),
+            directory=manifest.path if directory is None else directory,
+            pending=pending,
+        )
+        if not lazy:
+            config._load_all()
+        return config
 
     def __str__(self):
         return json.dumps(self.obj)
@@ -177,14 +393,38 @@ class JSONPriorConfig:
         -------
         A configuration dictionary
         """
+        value = self.lookup_for_class_and_suffix_path(cls, suffix_path)
+        if value is NoValue:
+            raise KeyError(
+                f"No config found for class {cls} and path {suffix_path} in {self.directory}"
+            )
+        return value
+
+    def lookup_for_class_and_suffix_path(
+        self, cls: Type, suffix_path: List[str], default=NoValue
+    ):
+        """
+        Get configuration for a prior without raising an exception if none is
+        found.
+
+        Parameters
+        ----------
+        cls
+            The class with which the prior is associated.
+        suffix_path
+            The path to the prior.
+        default
+            Returned if no configuration is found.
+
+        Returns
+        -------
+        A configuration dictionary or the default
+        """
         for c in family(cls):
-            try:
-                return self(path_for_class(c) + suffix_path)
-            except KeyError:
-                pass
-        raise KeyError(
-            f"No config found for class {cls} and path {suffix_path} in {self.directory}"
-        )
+            value = self.lookup(path_for_class(c) + suffix_path)
+            if value is not NoValue:
+                return value
+        return default
 
     def __call__(self, config_path: List[str]):
         """
@@ -208,11 +448,38 @@ class JSONPriorConfig:
         PriorException
             If no configuration is found.
         """
-        key = ".".join(config_path)
-        for path, value in self.path_value_tuples:
-            if key.endswith(path):
-                return value
-        raise KeyError(
-            f"No configuration was found for the path {config_path}"
-            + ("" if self.directory is None else f" ({self.directory})")
-        )
+        value = self.lookup(config_path)
+        if value is NoValue:
+            raise KeyError(
+                f"No configuration was found for the path {config_path}"
+                + ("" if self.directory is None else f" ({self.directory})")
+            )
+        return value
+
+    def lookup(self, config_path: List[str], default=NoValue):
+        """
+        Get the config at the end of the config_path without raising an exception
+        if none is found.
+
+        The configuration used is that for the longest configured path which
+        matches the end of config_path, comparing whole path components.
+
+        Parameters
+        ----------
+        config_path
+            The import path of a package, module, class or class and constructor
+            argument name.
+        default
+            Returned if no configuration is found.
+
+        Returns
+        -------
+        A configuration dictionary or value, or the default
+        """
+        components = ".".join(config_path).split(".")
+        if self._pending:
+            self._load_for(components)
+        value = self.trie.longest_suffix(components)
+        if value is NoValue:
+            return default
+        return value
@@ -0,0 +1,193 @@
+"""
+Lazy loading of large YAML config files.
+
+Files at least lazy_threshold bytes long are scanned once for the byte offsets of
+their top level keys and each top level section is only parsed when it is first
+accessed. Files which use YAML features that cannot be split safely, such as
+anchors, tags, several documents, keys that are not plain strings or quoted and
+flow scalars continuing onto unindented lines, are parsed in full as before. A
+document is also parsed in full if a section turns out not to parse on its own.
+
+The threshold may be set with the PYAUTO_CONFIG_LAZY_YAML_THRESHOLD environment
+variable. Set it to a very large number to disable lazy loading.
+"""
+import bisect
+import os
+import re
+from collections.abc import Mapping
+from typing import Dict, List, Optional, Tuple
+
+import yaml
+
+from autoconf import parsers
+
+LAZY_THRESHOLD_ENVIRONMENT_VARIABLE = "PYAUTO_CONFIG_LAZY_YAML_THRESHOLD"
+
+lazy_threshold = int(os.environ.get(LAZY_THRESHOLD_ENVIRONMENT_VARIABLE, 64 * 1024))
+
+# A line which is not indented, blank or a comment
+_TOP_LEVEL_LINE = re.compile(rb"^(?![ \t#\r\n]).+$", re.MULTILINE)
+# A top level key which is a plain string followed by a colon
+_TOP_LEVEL_KEY = re.compile(rb"^([A-Za-z_][A-Za-z0-9_.\- ]*?)[ \t]*:(?:[ \t]|\r?$)")
+# Comments, quoted scalars, which may be unclosed, and flow collection brackets.
+# Quotes only start a scalar at the start of a line or after whitespace, a flow
+# indicator, a colon or a dash.
+_TOKEN = re.compile(
+    rb"(?P<comment>(?:^|(?<=[ \t]))#[^\r\n]*)"
+    rb"|(?:^|(?<=[\s\[{,:\-]))(?P<quoted>"
+    rb'"(?:[^"\\]|\\.)*(?:"|\Z)'
+    rb"|'(?:[^']|'')*(?:'|\Z))"
+    rb"|(?P<open>[\[{])"
+    rb"|(?P<close>[\]}])",
+    re.MULTILINE | re.DOTALL,
+)
+# Anchors, aliases, tags and directives
+_UNSUPPORTED = re.compile(rb"(?:^|[\s\[{,:\-])[&*!%][^\s]")
+# Plain keys YAML resolves to something other than a string
+_NOT_STRINGS = {
+    "y",
+    "n",
+    "yes",
+    "no",
+    "on",
+    "off",
+    "true",
+    "false",
+    "null",
+}
+
+
+def _scalar_spans(data: bytes) -> List[Tuple[int, int]]:
+    """
+    The start and end offsets of quoted scalars and flow collections at the top
+    of the nesting, which a document cannot be split inside.
+    """
+    spans = list()
+    depth = 0
+    start = 0
+    for match in _TOKEN.finditer(data):
+        kind = match.lastgroup
+        if kind == "quoted" and depth == 0:
+            spans.append(match.span())
+        elif kind == "open":
+            if depth == 0:
+                start = match.start()
+            depth += 1
+        elif kind == "close" and depth > 0:
+            depth -= 1
+            if depth == 0:
+                spans.append((start, match.end()))
+    if depth > 0:
+        spans.append((start, len(data)))
+    return spans
+
+
+def index(data: bytes) -> Optional[Dict[str, Tuple[int, int]]]:
+    """
+    Find the start and end byte offsets of each top level section of a YAML
+    document.
+
+    Returns
+    -------
+    Offsets keyed by top level key, or None if the document cannot be split
+    """
+    if _UNSUPPORTED.search(data):
+        return None
+
+    spans = _scalar_spans(data)
+    span_starts = [start for start, _ in spans]
+
+    starts = list()
+    for match in _TOP_LEVEL_LINE.finditer(data):
+        i = bisect.bisect_left(span_starts, match.start()) - 1
+        if i >= 0 and spans[i][1] > match.start():
+            return None
+        key_match = _TOP_LEVEL_KEY.match(match.group(0))
+        if key_match is None:
+            return None
+        key = key_match.group(1).decode("utf-8")
+        if key.lower() in _NOT_STRINGS:
+            return None
+        starts.append((key, match.start()))
+
+    offsets = dict()
+    for i, (key, start) in enumerate(starts):
+        end = starts[i + 1][1] if i + 1 < len(starts) else len(data)
+        offsets[key] = (start, end)
+    return offsets
+
+
+class LazyYAMLDocument(Mapping):
+    __slots__ = ("data", "offsets", "_sections")
+
+    def __init__(self, data: bytes, offsets: Dict[str, Tuple[int, int]]):
+        """
+        A YAML document whose top level sections are parsed on first access.
+
+        Parameters
+        ----------
+        data
+            The contents of the file
+        offsets
+            The start and end byte offsets of each top level section
+        """
+        self.data = data
+        self.offsets = offsets
+        self._sections = dict()
+
+    def __getitem__(self, key):
+        try:
+            return self._sections[key]
+        except KeyError:
+            pass
+        start, end = self.offsets[key]
+        try:
+            section = yaml.load(self.data[start:end], Loader=parsers.SafeLoader)
+        except yaml.YAMLError:
+            section = None
+        if not isinstance(section, dict) or list(section) != [key]:
+            self._parse_all()
+            return self._sections[key]
+        return self._sections.setdefault(key, section[key])
+
+    def _parse_all(self):
+        """
+        Parse the whole document when it could not be split after all.
+        """
+        document = yaml.load(self.data, Loader=parsers.SafeLoader)
+        self._sections = dict(document)
+        self.offsets = dict.fromkeys(document, (0, len(self.data)))
+
+    def __iter__(self):
+        return iter(self.offsets)
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def __contains__(self, key):
+        return key in self.offsets
+
+    @property
+    def parsed(self) -> int:
+        """
+        The number of sections which have been parsed
+        """
+        return len(self._sections)
+
+
+def load_yaml(path):
+    """
+    Parse a YAML file, lazily if it is large enough and can be split into top
+    level sections.
+
+    Returns
+    -------
+    A dictionary or a LazyYAMLDocument
+    """
+    with parsers.open_binary(path) as f:
+        data = f.read()
+    if len(data) >= lazy_threshold:
+        offsets = index(data)
+        if offsets is not None:
+            return LazyYAMLDocument(data, offsets)
+    return yaml.load(data, Loader=parsers.SafeLoader)
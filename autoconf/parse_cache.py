@@ -0,0 +1,113 @@
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Union
+
+DEFAULT_MAXSIZE = 512
+
+
+class ParseCache:
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE):
+        """
+        A process-wide cache of parsed configuration files.
+
+        Entries are keyed on the resolved path of the file and the parser used to
+        read it. Each entry remembers the modification time and size of the file
+        when it was parsed so that an edited file is parsed again the next time it
+        is requested.
+
+        Members of zip archives provide their own cache_key and stamp so they are
+        cached without touching the filesystem.
+
+        Parameters
+        ----------
+        maxsize
+            The maximum number of parsed files held. The least recently used file
+            is evicted when this is exceeded.
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def load(self, path: Union[str, Path], parser: Callable):
+        """
+        Parse a file, or return the result of parsing it previously if it has not
+        changed since.
+
+        Parameters
+        ----------
+        path
+            The path to the file or an archive member
+        parser
+            A function which takes the path and returns the parsed contents
+
+        Returns
+        -------
+        The parsed contents of the file. This object is shared between every
+        caller and must not be modified.
+
+        Raises
+        ------
+        FileNotFoundError
+            If there is no file at the path
+        """
+        try:
+            stamp = path.stamp
+            key = (path.cache_key, parser)
+            resolved = path
+        except AttributeError:
+            resolved = os.path.realpath(path)
+            stat = os.stat(resolved)
+            stamp = (stat.st_mtime_ns, stat.st_size)
+            key = (resolved, parser)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == stamp:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        value = parser(resolved)
+
+        with self._lock:
+            self._entries[key] = (stamp, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self):
+        """
+        Remove every parsed file and reset the hit and miss counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        The fraction of loads that were served without parsing the file.
+        """
+        total = self.hits + self.misses
+        if total == 0:
+            return 0.0
+        return self.hits / total
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return (
+            f"<{self.__class__.__name__} size={len(self)} "
+            f"hits={self.hits} misses={self.misses}>"
+        )
+
+
+parse_cache = ParseCache()
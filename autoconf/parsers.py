@@ -0,0 +1,98 @@
+"""
+Parsers used to load configuration and prior files, keyed by file suffix.
+
+YAML is loaded with libyaml's C loader when PyYAML was built with it, which is
+several times faster than the pure Python loader. TOML is supported when tomllib
+(Python 3.11+) or tomli is installed.
+
+Further formats can be added with register_parser. Every parser takes a path, or a
+member of a zip archive (see autoconf.archive), and returns the parsed contents.
+"""
+import json
+from typing import Callable, Dict
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeLoader
+
+try:
+    import tomllib
+except ImportError:  # pragma: no cover - Python < 3.11
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+
+def open_binary(path):
+    """
+    Open a file for reading bytes. Members of zip archives are opened from the
+    archive's contents in memory.
+    """
+    try:
+        return path.open_binary()
+    except AttributeError:
+        return open(path, "rb")
+
+
+def load_yaml(path):
+    with open_binary(path) as f:
+        return yaml.load(f, Loader=SafeLoader)
+
+
+def load_json(path):
+    with open_binary(path) as f:
+        return json.load(f)
+
+
+def load_toml(path):
+    with open_binary(path) as f:
+        return tomllib.load(f)
+
+
+_parsers: Dict[str, Callable] = {
+    ".json": load_json,
+    ".yaml": load_yaml,
+    ".yml": load_yaml,
+}
+if tomllib is not None:
+    _parsers[".toml"] = load_toml
+
+
+def register_parser(suffix: str, parser: Callable):
+    """
+    Register a parser for files with a given suffix. This is used for config
+    files in config directories and for prior files.
+
+    Parameters
+    ----------
+    suffix
+        The file suffix including the dot, e.g. ".toml"
+    parser
+        A function taking a path and returning nested dictionaries. It should
+        open the path with open_binary to support zip archives.
+    """
+    _parsers[suffix] = parser
+
+
+def parser_for_suffix(suffix: str) -> Callable:
+    """
+    The parser for files with a given suffix.
+
+    Raises
+    ------
+    KeyError
+        If no parser is registered for the suffix
+    """
+    return _parsers[suffix]
+
+
+def suffixes():
+    """
+    The suffixes for which parsers are registered, in the order they were
+    registered.
+    """
+    return tuple(_parsers)
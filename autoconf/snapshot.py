@@ -0,0 +1,149 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import List, Optional, Union
+
+from autoconf.directory_config import DirectoryManifest, config_suffixes
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_DIRECTORY_ENVIRONMENT_VARIABLE = "PYAUTO_CONFIG_SNAPSHOT_DIR"
+SNAPSHOT_VERSION = 2
+
+
+def snapshot_directory_from_environment() -> Optional[Path]:
+    """
+    The directory in which config snapshots are stored, if one is set by the
+    PYAUTO_CONFIG_SNAPSHOT_DIR environment variable.
+    """
+    directory = os.environ.get(SNAPSHOT_DIRECTORY_ENVIRONMENT_VARIABLE)
+    if not directory:
+        return None
+    return Path(directory)
+
+
+class ConfigSnapshot:
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        manifests: List[DirectoryManifest],
+    ):
+        """
+        A compiled copy of the merged configuration for a list of config paths,
+        stored as a single JSON file.
+
+        The snapshot records the modification time and size of every config file it
+        was compiled from and is only used if none of those files have changed.
+
+        Parameters
+        ----------
+        directory
+            The directory in which snapshot files are stored
+        manifests
+            Manifests of the config directories in order of priority
+        """
+        self.directory = Path(directory)
+        self.manifests = manifests
+        self.config_paths = [str(manifest.path) for manifest in manifests]
+        self._manifest = None
+
+    @property
+    def path(self) -> Path:
+        """
+        The path of the snapshot file. There is one file per list of config paths.
+        """
+        digest = hashlib.sha256("\n".join(self.config_paths).encode()).hexdigest()
+        return self.directory / f"{digest}.json"
+
+    @property
+    def manifest(self) -> List:
+        """
+        The relative path, modification time and size of every config file in
+        every config directory. This is computed once per snapshot instance.
+        """
+        if self._manifest is not None:
+            return self._manifest
+
+        manifest = []
+        for directory_manifest in self.manifests:
+            entries = []
+            for path, entry in directory_manifest.files(
+                config_suffixes(), exclude=("priors",)
+            ):
+                stat = entry.stat()
+                entries.append([path, stat.st_mtime_ns, stat.st_size])
+            manifest.append([str(directory_manifest.path), sorted(entries)])
+        self._manifest = manifest
+        return self._manifest
+
+    def load(self) -> Optional[dict]:
+        """
+        Load the merged configuration from the snapshot.
+
+        Returns
+        -------
+        A nested dictionary of configuration or None if there is no snapshot, it
+        cannot be read or any of the config files have changed since it was made.
+        """
+        try:
+            with open(self.path, "rb") as f:
+                snapshot = json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"Could not read config snapshot {self.path}: {e}")
+            return None
+
+        if (
+            not isinstance(snapshot, dict)
+            or snapshot.get("version") != SNAPSHOT_VERSION
+            or snapshot.get("manifest") != self.manifest
+        ):
+            logger.debug(f"Config snapshot {self.path} is out of date")
+            return None
+        return snapshot["tree"]
+
+    def save(self, tree: dict):
+        """
+        Save the merged configuration. The file is replaced atomically so other
+        processes never read a partially written snapshot.
+
+        Nothing is saved if the configuration does not survive a round trip through
+        JSON unchanged, e.g. if it has keys which are not strings.
+
+        Parameters
+        ----------
+        tree
+            A nested dictionary of configuration
+        """
+        snapshot = {
+            "version": SNAPSHOT_VERSION,
+            "manifest": self.manifest,
+            "tree": tree,
+        }
+        try:
+            text = json.dumps(snapshot)
+            if json.loads(text)["tree"] != tree:
+                raise ValueError("configuration cannot be represented as JSON")
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Could not write config snapshot {self.path}: {e}")
+            return
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, temporary_path = tempfile.mkstemp(dir=self.directory)
+        except OSError as e:
+            logger.debug(f"Could not write config snapshot {self.path}: {e}")
+            return
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(text)
+            os.replace(temporary_path, self.path)
+        except Exception as e:
+            logger.debug(f"Could not write config snapshot {self.path}: {e}")
+            try:
+                os.remove(temporary_path)
+            except OSError:
+                pass
@@ -0,0 +1,56 @@
+import threading
+from contextlib import contextmanager
+
+
+class ReadWriteLock:
+    def __init__(self):
+        """
+        A lock which may be held by many readers or a single writer.
+
+        The writer may reacquire the lock, for reading or writing, while it holds
+        it. Readers are not blocked by waiting writers so reads may be nested.
+        """
+        self._condition = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = None
+        self._writer_depth = 0
+
+    @contextmanager
+    def read(self):
+        """
+        Hold the lock for reading for the scope of a with block.
+        """
+        me = threading.get_ident()
+        with self._condition:
+            if self._writer != me:
+                while self._writer is not None:
+                    self._condition.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._readers -= 1
+                if self._readers == 0:
+                    self._condition.notify_all()
+
+    @contextmanager
+    def write(self):
+        """
+        Hold the lock for writing for the scope of a with block.
+        """
+        me = threading.get_ident()
+        with self._condition:
+            if self._writer != me:
+                while self._writer is not None or self._readers > 0:
+                    self._condition.wait()
+                self._writer = me
+            self._writer_depth += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._writer_depth -= 1
+                if self._writer_depth == 0:
+                    self._writer = None
+                    self._condition.notify_all()
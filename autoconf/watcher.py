@@ -0,0 +1,154 @@
+"""
+Reload configuration when files in config directories change.
+
+e.g.
+
+    watcher = ConfigWatcher(conf.instance, interval=2.0)
+    watcher.start()
+
+Config directories are polled with os.scandir in a background thread. When a file
+changes only the configuration loaded from that file, or the prior configuration of
+that directory, is discarded and Config.generation is incremented so caches built
+on top of configuration can tell they are stale.
+"""
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from autoconf import conf
+from autoconf.archive import split_archive_path
+from autoconf.directory_config import RecursiveConfig, config_suffixes
+
+logger = logging.getLogger(__name__)
+
+Stamp = Tuple[int, int]
+
+
+def _stamp(stat) -> Stamp:
+    return stat.st_mtime_ns, stat.st_size
+
+
+def scan(path: Path, suffixes: Tuple[str, ...]) -> Dict[str, Stamp]:
+    """
+    The modification time and size of every config file in a directory, keyed by
+    path relative to the directory.
+
+    A zip archive is treated as a single file with an empty relative path.
+    """
+    split = split_archive_path(path)
+    if split is not None:
+        archive_path, _ = split
+        try:
+            return {"": _stamp(os.stat(archive_path))}
+        except FileNotFoundError:
+            return dict()
+
+    stamps = dict()
+
+    def scan_directory(directory, prefix):
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except (FileNotFoundError, NotADirectoryError):
+            return
+        for entry in entries:
+            if entry.is_dir():
+                scan_directory(entry.path, f"{prefix}{entry.name}/")
+            elif entry.name.endswith(suffixes):
+                stamps[f"{prefix}{entry.name}"] = _stamp(entry.stat())
+
+    scan_directory(path, "")
+    return stamps
+
+
+class ConfigWatcher:
+    def __init__(self, config=None, interval: float = 1.0):
+        """
+        Poll the directories of a Config for changed, added or removed files and
+        reload the affected configuration.
+
+        Parameters
+        ----------
+        config
+            The Config to watch. Defaults to conf.instance.
+        interval
+            Seconds between polls when running in the background
+        """
+        self.config = conf.instance if config is None else config
+        self.interval = interval
+        self._stamps: Dict[str, Dict[str, Stamp]] = dict()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self.poll()
+
+    def poll(self) -> List[Tuple[Path, str]]:
+        """
+        Check every config directory once and reload any changes.
+
+        Directories pushed since the last poll are recorded without being reloaded.
+
+        Returns
+        -------
+        The config directories and relative paths of files which changed
+        """
+        suffixes = config_suffixes()
+        changes = list()
+        stamps = dict()
+        for config in self.config.configs:
+            if not isinstance(config, RecursiveConfig):
+                continue
+            path = config.path
+            key = str(path)
+            current = scan(path, suffixes)
+            stamps[key] = current
+            previous = self._stamps.get(key)
+            if previous is None:
+                continue
+            for file in sorted(set(previous) | set(current)):
+                if previous.get(file) != current.get(file):
+                    changes.append((path, file))
+        self._stamps = stamps
+
+        if changes:
+            logger.info(
+                "Reloading config for changed files: "
+                + ", ".join(f"{path}/{file}" for path, file in changes)
+            )
+            self.config.reload(changes)
+        return changes
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.poll()
+            except Exception as e:  # pragma: no cover - keep watching after errors
+                logger.exception(e)
+
+    def start(self) -> "ConfigWatcher":
+        """
+        Poll in a daemon thread until stop is called.
+        """
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="ConfigWatcher", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self):
+        """
+        Stop polling and wait for the background thread to finish.
+        """
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
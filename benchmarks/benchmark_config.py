@@ -0,0 +1,220 @@
+#!/usr/bin/env python
+"""
+Benchmarks for the config subsystem (autoconf.conf and autoconf.directory_config).
+
+Each scenario generates a synthetic config tree (see synthetic.py) and times:
+
+- construct: creating a Config for the tree
+- first_lookup: the first lookup of a deeply nested key with no files parsed
+- warm_lookup: repeating that lookup once everything is loaded
+- warm_get: the same lookup with Config.get and a dotted path
+- push: pushing an extra layer onto a Config which has already been read
+- materialize: resolving the entire merged tree with Config.dict.dict()
+- family_hit / family_miss: DictWrapper.family for a deep class hierarchy
+
+Times are the minimum over several repeats, in seconds per operation.
+
+Usage:
+    python benchmarks/benchmark_config.py                  # run and compare to baseline
+    python benchmarks/benchmark_config.py --update         # run and overwrite baseline
+    python benchmarks/benchmark_config.py --threshold 2.0  # fail if 2x slower
+
+The autoconf package must be importable. When run from a checkout the repository
+root is added to sys.path so the checkout is benchmarked rather than an installed
+copy.
+
+The baseline is stored in benchmarks/baseline.json. Baselines are machine specific
+so compare runs on the same machine.
+"""
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from synthetic import deepest_key, generate_layers, write_file
+
+from autoconf import conf
+from autoconf.parse_cache import parse_cache
+
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+
+SCENARIOS = {
+    "small_yaml": dict(n_files=10, depth=1, file_format="yaml", n_layers=1),
+    "small_ini": dict(n_files=10, depth=1, file_format="ini", n_layers=1),
+    "deep_yaml": dict(n_files=20, depth=5, file_format="yaml", n_layers=1),
+    "layered_yaml": dict(n_files=20, depth=2, file_format="yaml", n_layers=4),
+    "large_mixed": dict(n_files=200, depth=3, file_format="ini", n_layers=2),
+}
+
+REPEATS = 5
+WARM_ITERATIONS = 10000
+FAMILY_DEPTH = 20
+
+
+def best_of(func, repeats=REPEATS, setup=None, iterations=1) -> float:
+    """
+    The minimum time per iteration over several repeats.
+    """
+    times = []
+    for _ in range(repeats):
+        state = setup() if setup is not None else None
+        start = time.perf_counter()
+        for _ in range(iterations):
+            func(state)
+        times.append((time.perf_counter() - start) / iterations)
+    return min(times)
+
+
+def lookup(config, key_path):
+    value = config
+    for key in key_path:
+        value = value[key]
+    return value
+
+
+def make_hierarchy(depth: int):
+    """
+    A chain of classes where only the root, Class0, has configuration.
+    """
+    cls = type("Class0", (), {})
+    for i in range(1, depth):
+        cls = type(f"Class{i}", (cls,), {})
+    return cls
+
+
+def run_scenario(directory: Path, n_layers: int, **kwargs) -> dict:
+    paths = generate_layers(directory / "layers", n_layers=n_layers, **kwargs)
+    key_path = deepest_key(**kwargs)
+    dotted = ".".join(key_path)
+
+    extra = directory / "extra"
+    extra.mkdir()
+    write_file(extra / "file_0", "yaml", n_sections=5, n_keys=10, layer=-1)
+
+    family_directory = directory / "family"
+    family_directory.mkdir()
+    with open(family_directory / "family.ini", "w") as f:
+        f.write("[labels]\nClass0=root\n")
+
+    def cold_config(_=None):
+        parse_cache.clear()
+        return conf.Config(*paths)
+
+    def warm_config():
+        config = cold_config()
+        config.dict.dict()
+        return config
+
+    hierarchy = make_hierarchy(FAMILY_DEPTH)
+    family_config = conf.Config(family_directory)
+    labels = family_config["family"]["labels"]
+    unconfigured = type("Unconfigured", (), {})
+
+    def family_miss(_):
+        try:
+            labels.family(unconfigured)
+        except KeyError:
+            pass
+
+    return {
+        "construct": best_of(cold_config),
+        "first_lookup": best_of(
+            lambda config: lookup(config, key_path), setup=cold_config
+        ),
+        "warm_lookup": best_of(
+            lambda config: lookup(config, key_path),
+            setup=warm_config,
+            iterations=WARM_ITERATIONS,
+        ),
+        "warm_get": best_of(
+            lambda config: config.get(dotted),
+            setup=warm_config,
+            iterations=WARM_ITERATIONS,
+        ),
+        "push": best_of(lambda config: config.push(extra), setup=warm_config),
+        "materialize": best_of(lambda config: config.dict.dict(), setup=cold_config),
+        "family_hit": best_of(
+            lambda _: labels.family(hierarchy), iterations=WARM_ITERATIONS
+        ),
+        "family_miss": best_of(family_miss, iterations=WARM_ITERATIONS),
+    }
+
+
+def run(scenarios=SCENARIOS) -> dict:
+    results = dict()
+    for name, kwargs in scenarios.items():
+        with tempfile.TemporaryDirectory() as directory:
+            results[name] = run_scenario(Path(directory), **kwargs)
+        print(f"{name}: done", file=sys.stderr)
+    return results
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """
+    Print each timing relative to the baseline and return the regressions.
+    """
+    regressions = []
+    for scenario, timings in results.items():
+        for metric, seconds in timings.items():
+            base = baseline.get(scenario, {}).get(metric)
+            if base is None:
+                print(f"{scenario:>14} {metric:>14} {seconds:.3e}s (new)")
+                continue
+            ratio = seconds / base if base else float("inf")
+            flag = " REGRESSION" if ratio > threshold else ""
+            print(
+                f"{scenario:>14} {metric:>14} {seconds:.3e}s "
+                f"baseline {base:.3e}s x{ratio:.2f}{flag}"
+            )
+            if flag:
+                regressions.append((scenario, metric, ratio))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument(
+        "--update", action="store_true", help="Overwrite the stored baseline"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.5,
+        help="Ratio to the baseline above which a timing is a regression",
+    )
+    parser.add_argument(
+        "--scenario", action="append", help="Only run the named scenario(s)"
+    )
+    args = parser.parse_args()
+
+    scenarios = SCENARIOS
+    if args.scenario:
+        scenarios = {name: SCENARIOS[name] for name in args.scenario}
+
+    results = run(scenarios)
+
+    if args.update:
+        baseline = dict()
+        if BASELINE_PATH.exists():
+            with open(BASELINE_PATH) as f:
+                baseline = json.load(f)
+        baseline.update(results)
+        with open(BASELINE_PATH, "w") as f:
+            json.dump(baseline, f, indent=4, sort_keys=True)
+        print(f"Baseline written to {BASELINE_PATH}")
+        return
+
+    baseline = dict()
+    if BASELINE_PATH.exists():
+        with open(BASELINE_PATH) as f:
+            baseline = json.load(f)
+    if compare(results, baseline, args.threshold):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
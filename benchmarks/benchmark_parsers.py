@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+"""
+Compare parser backends on prior files.
+
+Every JSON and YAML file in the given prior directories is loaded into memory and
+then parsed repeatedly with:
+
+- yaml_python: yaml.load with the pure Python SafeLoader
+- yaml_c: yaml.load with libyaml's CSafeLoader, if available
+- json: json.loads of the same content serialised as JSON
+
+Times are totals over all files, as the minimum over several repeats.
+
+Usage:
+    python benchmarks/benchmark_parsers.py [prior_directory ...]
+
+Pass the priors directories shipped with a project, e.g. the config/priors
+directory of PyAutoGalaxy or PyAutoLens. Defaults to the priors in this repository.
+"""
+import json
+import sys
+import time
+from pathlib import Path
+
+import yaml
+
+REPEATS = 5
+
+DEFAULT_DIRECTORIES = [
+    Path(__file__).parent.parent / "priors",
+    Path(__file__).parent.parent / "test_autoconf" / "files" / "config" / "priors",
+    Path(__file__).parent.parent / "test_autoconf" / "files" / "default" / "priors",
+]
+
+
+def load_documents(directories):
+    """
+    The contents of every prior file as (YAML text, JSON text) pairs.
+    """
+    documents = []
+    for directory in directories:
+        for path in sorted(Path(directory).rglob("*")):
+            if path.suffix not in (".json", ".yaml", ".yml"):
+                continue
+            text = path.read_text()
+            if path.suffix == ".json":
+                obj = json.loads(text)
+                yaml_text = yaml.safe_dump(obj)
+                json_text = text
+            else:
+                obj = yaml.safe_load(text)
+                yaml_text = text
+                json_text = json.dumps(obj)
+            documents.append((yaml_text, json_text))
+    return documents
+
+
+def best_of(func, documents) -> float:
+    times = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        for document in documents:
+            func(document)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    directories = sys.argv[1:] or DEFAULT_DIRECTORIES
+    documents = load_documents(directories)
+    if not documents:
+        print("No prior files found")
+        return
+
+    backends = {
+        "yaml_python": lambda document: yaml.load(
+            document[0], Loader=yaml.SafeLoader
+        ),
+        "json": lambda document: json.loads(document[1]),
+    }
+    if getattr(yaml, "__with_libyaml__", False):
+        backends["yaml_c"] = lambda document: yaml.load(
+            document[0], Loader=yaml.CSafeLoader
+        )
+    else:
+        print("libyaml is not available; yaml_c skipped")
+
+    size = sum(len(document[0]) for document in documents)
+    print(f"{len(documents)} files, {size} bytes of YAML")
+
+    baseline = None
+    for name, func in backends.items():
+        seconds = best_of(func, documents)
+        baseline = baseline or seconds
+        print(f"{name:>12} {seconds:.4e}s x{baseline / seconds:.1f} vs yaml_python")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+Generate synthetic config trees for benchmarking.
+
+A tree is a directory of config files, optionally nested in subdirectories, in
+which every file has the same sections and keys. Several trees can be generated
+as layers which override one another.
+"""
+from pathlib import Path
+from typing import List, Union
+
+import yaml
+
+
+def _section(n_keys: int, layer: int) -> dict:
+    return {f"key_{k}": f"value_{layer}_{k}" for k in range(n_keys)}
+
+
+def write_file(
+    path: Path,
+    file_format: str,
+    n_sections: int,
+    n_keys: int,
+    layer: int = 0,
+):
+    """
+    Write a single config file with n_sections each containing n_keys.
+
+    Parameters
+    ----------
+    path
+        The path without a suffix
+    file_format
+        "yaml" or "ini"
+    """
+    sections = {f"section_{s}": _section(n_keys, layer) for s in range(n_sections)}
+    if file_format == "yaml":
+        with open(path.with_suffix(".yaml"), "w") as f:
+            yaml.safe_dump(sections, f)
+    elif file_format == "ini":
+        with open(path.with_suffix(".ini"), "w") as f:
+            for name, section in sections.items():
+                f.write(f"[{name}]\n")
+                for key, value in section.items():
+                    f.write(f"{key}={value}\n")
+                f.write("\n")
+    else:
+        raise ValueError(f"Unknown format {file_format}")
+
+
+def generate_tree(
+    root: Union[str, Path],
+    n_files: int = 10,
+    depth: int = 1,
+    file_format: str = "yaml",
+    n_sections: int = 5,
+    n_keys: int = 10,
+    layer: int = 0,
+) -> Path:
+    """
+    Generate a directory of config files.
+
+    Files are named file_0, file_1... and placed in a chain of subdirectories
+    named level_1/level_2/... so that the deepest file is depth - 1 directories
+    below the root. Files are spread evenly over the levels.
+
+    Parameters
+    ----------
+    root
+        The directory to create
+    n_files
+        The total number of files
+    depth
+        The number of directory levels containing files
+    file_format
+        "yaml" or "ini"
+    n_sections
+        The number of sections in each file
+    n_keys
+        The number of keys in each section
+    layer
+        An index included in values so layers can be told apart
+
+    Returns
+    -------
+    The root directory
+    """
+    root = Path(root)
+    for i in range(n_files):
+        level = i % depth
+        directory = root.joinpath(*[f"level_{d + 1}" for d in range(level)])
+        directory.mkdir(parents=True, exist_ok=True)
+        write_file(directory / f"file_{i}", file_format, n_sections, n_keys, layer)
+    return root
+
+
+def generate_layers(
+    root: Union[str, Path], n_layers: int = 1, **kwargs
+) -> List[Path]:
+    """
+    Generate several trees with the same structure to be used as config paths
+    in order of priority.
+
+    Parameters
+    ----------
+    root
+        A directory in which to create one subdirectory per layer
+    n_layers
+        The number of layers
+    kwargs
+        Passed to generate_tree
+
+    Returns
+    -------
+    The directory of each layer
+    """
+    root = Path(root)
+    return [
+        generate_tree(root / f"layer_{layer}", layer=layer, **kwargs)
+        for layer in range(n_layers)
+    ]
+
+
+def deepest_key(n_files: int = 10, depth: int = 1, **_) -> List[str]:
+    """
+    The path to a key in the most deeply nested file of a generated tree.
+    """
+    index = max(i for i in range(n_files) if i % depth == depth - 1)
+    return [f"level_{d + 1}" for d in range(depth - 1)] + [
+        f"file_{index}",
+        "section_0",
+        "key_0",
+    ]
@@ -1,7 +1,9 @@
+import threading
+
 import pytest
 
 import autoconf as aconf
-from autoconf.mock.mock_real import SphProfile
+from autoconf.mock.mock_real import Redshift, SphProfile
 
 
 @pytest.fixture(name="geometry_profile_path")
@@ -71,7 +73,7 @@ def test_path_for_class(geometry_profile_path):
 )
 def test_paths(config_dict, paths):
     config = aconf.JSONPriorConfig(config_dict)
-    assert config.paths == paths
+    assert list(config.paths) == paths
 
 
 @pytest.mark.parametrize(
@@ -101,3 +103,84 @@ def test_config_for_path(geometry_profile_path, config_dict):
 def test_path_double():
     config = aconf.JSONPriorConfig({"mock_real": {"SphProfile": "test"}})
     assert config(["something", "mock_real", "mock_real", "SphProfile"]) == "test"
+
+
+def test_lookup():
+    config = aconf.JSONPriorConfig({"mock_real": {"SphProfile": "test"}})
+    assert config.lookup(["mock_real", "Other"], None) is None
+    assert config.lookup_for_class_and_suffix_path(SphProfile, []) == "test"
+
+
+def test_longest_suffix():
+    config = aconf.JSONPriorConfig(
+        {
+            "SphProfile": "short",
+            "mock_real": {"SphProfile": "long"},
+            "Profile": "partial",
+        }
+    )
+    assert config(["autoconf", "mock", "mock_real", "SphProfile"]) == "long"
+    assert config(["autoconf", "other", "SphProfile"]) == "short"
+    assert config.lookup(["autoconf", "mock", "mock_real.SphProfile"]) == "long"
+
+
+def test_whole_components():
+    config = aconf.JSONPriorConfig({"Profile": "partial"})
+    assert config.lookup(["autoconf", "SphProfile"], None) is None
+
+
+@pytest.fixture(name="priors_directory")
+def make_priors_directory(files_directory):
+    return files_directory / "config" / "priors"
+
+
+def test_lazy(priors_directory):
+    config = aconf.JSONPriorConfig.from_directory(priors_directory)
+    assert set(config._pending) == {
+        "mock_real",
+        "test_yaml_config",
+        "subdirectory.subconfig",
+    }
+
+    assert config.lookup_for_class_and_suffix_path(Redshift, ["redshift"])[
+        "upper_limit"
+    ] == 3.0
+    assert set(config._pending) == {"test_yaml_config", "subdirectory.subconfig"}
+
+    assert "subdirectory.subconfig.SubClass.variable" in config.path_value_map
+    assert not config._pending
+
+
+def test_lazy_matches_eager(priors_directory):
+    lazy = aconf.JSONPriorConfig.from_directory(priors_directory)
+    eager = aconf.JSONPriorConfig.from_directory(priors_directory, lazy=False)
+
+    assert not eager._pending
+    assert lazy.obj == eager.obj
+
+
+def test_lazy_concurrent_lookup():
+    parsing = threading.Event()
+    release = threading.Event()
+
+    def parse(file):
+        parsing.set()
+        release.wait(5)
+        return {"Redshift": {"upper_limit": 3.0}}
+
+    config = aconf.JSONPriorConfig(
+        dict(), pending={"autoconf.mock.mock_real": (parse, None)}
+    )
+    path = ["autoconf", "mock", "mock_real", "Redshift"]
+    results = list()
+    first = threading.Thread(target=lambda: results.append(config.lookup(path)))
+    first.start()
+    parsing.wait(5)
+
+    second = threading.Thread(target=lambda: results.append(config.lookup(path)))
+    second.start()
+    release.set()
+    first.join()
+    second.join()
+
+    assert results == [{"upper_limit": 3.0}] * 2
@@ -0,0 +1,124 @@
+import pickle
+import sys
+import zipfile
+
+import pytest
+
+from autoconf import conf
+from autoconf.archive import main, pack, resource_path, split_archive_path
+from autoconf.directory_config import ArchiveManifest, RecursiveConfig
+from autoconf.json_prior.config import JSONPriorConfig
+from autoconf.mock.mock_real import Redshift
+
+
+@pytest.fixture(name="archives")
+def make_archives(files_directory, tmp_path):
+    config = tmp_path / "config.zip"
+    default = tmp_path / "default.zip"
+    pack(files_directory / "config", config)
+    pack(files_directory / "default", default)
+    return config, default
+
+
+@pytest.fixture(name="archive_config")
+def make_archive_config(archives):
+    return conf.Config(*archives)
+
+
+def test_split(archives, tmp_path):
+    config, _ = archives
+    assert split_archive_path(config / "priors") == (config, "priors")
+    assert split_archive_path(config) == (config, "")
+    assert split_archive_path(tmp_path / "config") is None
+
+
+def test_manifest(archives):
+    config = RecursiveConfig(archives[0])
+
+    assert isinstance(config.manifest, ArchiveManifest)
+    assert config.manifest.is_dir("text")
+    assert "general" in config.keys()
+    assert "priors" not in config.keys()
+
+
+def test_values(archive_config, session_config):
+    assert archive_config["general"]["hpc"]["hpc_mode"] is False
+    assert archive_config["general"]["hpc"]["default_field"] == "hello"
+    assert archive_config["text"]["label"]["superscript"]["Galaxy"] == "g"
+    assert archive_config["default_file"]["section"]["key"] == "file value"
+    assert archive_config.dict.dict() == session_config.dict.dict()
+
+
+def test_pickle(archive_config):
+    assert archive_config["general"]["hpc"]["hpc_mode"] is False
+
+    loaded = pickle.loads(pickle.dumps(archive_config))
+    assert loaded["general"]["hpc"]["default_field"] == "hello"
+    assert loaded["text"]["label"]["superscript"]["Galaxy"] == "g"
+    assert isinstance(loaded.configs[0].manifest, ArchiveManifest)
+
+
+def test_logging_config(archive_config):
+    assert archive_config.logging_config["name"] == "config"
+
+
+def test_priors(archive_config):
+    prior_config = archive_config.prior_config
+    assert (
+        prior_config.for_class_and_suffix_path(Redshift, ["redshift"])["upper_limit"]
+        == 3.0
+    )
+    assert (
+        prior_config.for_class_and_suffix_path(Redshift, ["rodshift"])["upper_limit"]
+        == 4.0
+    )
+
+
+def test_prior_directory(archives, files_directory):
+    config, _ = archives
+    from_archive = JSONPriorConfig.from_directory(config / "priors")
+    from_directory = JSONPriorConfig.from_directory(files_directory / "config" / "priors")
+
+    assert from_archive.obj == from_directory.obj
+
+
+def test_push(config, archives):
+    _, default = archives
+    config.push(default)
+
+    assert config["general"]["hpc"]["hpc_mode"] is True
+
+
+def test_nested_archive_path(files_directory, tmp_path):
+    bundle = tmp_path / "bundle.zip"
+    with zipfile.ZipFile(bundle, "w") as archive:
+        archive.write(files_directory / "config" / "general.yaml", "config/general.yaml")
+
+    config = conf.Config(bundle / "config")
+    assert config["general"]["hpc"]["hpc_mode"] is False
+
+
+def test_resource_path(files_directory, tmp_path, monkeypatch):
+    bundle = tmp_path / "package.zip"
+    with zipfile.ZipFile(bundle, "w") as archive:
+        archive.writestr("zipped_package/__init__.py", "")
+        archive.write(
+            files_directory / "config" / "general.yaml",
+            "zipped_package/config/general.yaml",
+        )
+    monkeypatch.syspath_prepend(str(bundle))
+
+    path = resource_path("zipped_package")
+    assert path == bundle / "zipped_package" / "config"
+    assert conf.Config(path)["general"]["hpc"]["hpc_mode"] is False
+
+
+def test_cli(files_directory, tmp_path, monkeypatch):
+    archive = tmp_path / "packed.zip"
+    monkeypatch.setattr(
+        sys, "argv", ["autoconf.archive", str(files_directory / "config"), str(archive)]
+    )
+    main()
+
+    with zipfile.ZipFile(archive) as f:
+        assert "priors/mock_real.json" in f.namelist()
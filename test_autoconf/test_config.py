@@ -1,13 +1,20 @@
 import os
+import pickle
 import shutil
 from os import path
 
 import pytest
 
 from autoconf import conf
-from autoconf.directory_config import NamedConfig
+from autoconf.directory_config import (
+    NamedConfig,
+    RecursiveConfig,
+    DirectoryManifest,
+    NoValue,
+    family,
+)
 from autoconf.mock.mock_real import EllProfile, Gaussian
-from autoconf.exc import ConfigException
+from autoconf.exc import ConfigException, MissingConfigError, MissingFamilyError
 
 directory = path.dirname(path.realpath(__file__))
 
@@ -66,3 +73,165 @@ def test_path_empty(config):
     os.makedirs(BAD_PATH, exist_ok=True)
     with pytest.raises(ConfigException):
         config.push(BAD_PATH)
+
+
+class TestManifest:
+    def test_shared_with_children(self, files_directory):
+        config = RecursiveConfig(files_directory / "config")
+        child = config["one"]
+
+        assert child.manifest is config.manifest.child("one")
+        assert "two.ini" in child.manifest
+
+    def test_keys(self, files_directory):
+        config = RecursiveConfig(files_directory / "config")
+        assert "priors" not in config.keys()
+        assert {"general", "label", "one", "text"} <= set(config.keys())
+
+    def test_missing(self, tmp_path):
+        manifest = DirectoryManifest(tmp_path / "missing")
+        assert not manifest.exists
+        assert not manifest.has_files((".yaml",))
+
+    def test_pickle(self, files_directory):
+        config = RecursiveConfig(files_directory / "config")
+        assert "general" in config.keys()
+
+        loaded = pickle.loads(pickle.dumps(config))
+        assert loaded["one"].manifest.exists
+        assert set(loaded.keys()) == set(config.keys())
+
+
+class TestLookup:
+    def test_named_config(self, label_config):
+        assert label_config.lookup("missing") is NoValue
+        assert label_config["label"].lookup("redshift") == "z"
+        assert label_config["label"].lookup("missing", None) is None
+
+    def test_dict_wrapper(self, files_directory):
+        config = conf.Config(files_directory / "config")
+        assert config.dict.lookup("missing") is NoValue
+        assert config["general"].lookup("HPC")["hpc_mode"] is False
+
+    def test_missing_error(self, files_directory):
+        config = conf.Config(files_directory / "config")
+        with pytest.raises(MissingConfigError) as info:
+            config["missing"]
+
+        assert isinstance(info.value, KeyError)
+        assert str(files_directory / "config") in str(info.value)
+
+    @pytest.mark.parametrize("cls", [MissingConfigError, MissingFamilyError])
+    def test_missing_error_pickle(self, cls):
+        error = cls("key", ["path"])
+        loaded = pickle.loads(pickle.dumps(error))
+
+        assert type(loaded) is cls
+        assert loaded.key == "key"
+        assert loaded.paths == ["path"]
+        assert str(loaded) == str(error)
+
+
+class Base:
+    pass
+
+
+class Left(Base):
+    pass
+
+
+class Right(Base):
+    pass
+
+
+class Diamond(Left, Right):
+    pass
+
+
+class TestFamily:
+    def test_deduplicated(self):
+        assert family(Diamond) == (Diamond, Left, Right, Base, object)
+
+    def test_dict_wrapper(self, files_directory):
+        config = conf.Config(files_directory / "config")
+        assert config["label"]["superscript"].family(Gaussian) == "l"
+
+    def test_miss_cached(self, files_directory):
+        config = conf.Config(files_directory / "config")
+        superscript = config["label"]["superscript"]
+        with pytest.raises(KeyError):
+            superscript.family(MockClass)
+        assert MockClass in superscript._family_misses
+        with pytest.raises(MissingFamilyError, match="or its parents not found"):
+            superscript.family(MockClass)
+
+        superscript["MockClass"] = "m"
+        assert superscript.family(MockClass) == "m"
+
+
+class TestTypedIni:
+    @pytest.fixture(name="ini_config")
+    def make_ini_config(self, tmp_path):
+        path = tmp_path / "typed.ini"
+        path.write_text(
+            "[section]\nFlag = True\nnothing=None\ncount=3\nratio=0.5\nname=x\n"
+        )
+        return NamedConfig(path)
+
+    def test_types(self, ini_config):
+        section = ini_config["section"]
+        assert section["flag"] is True
+        assert section["nothing"] is None
+        assert section["count"] == 3
+        assert section["ratio"] == 0.5
+        assert section["name"] == "x"
+
+    def test_keys(self, ini_config):
+        assert list(ini_config["section"].keys()) == [
+            "Flag",
+            "nothing",
+            "count",
+            "ratio",
+            "name",
+        ]
+
+    def test_missing(self, ini_config):
+        with pytest.raises(KeyError):
+            ini_config["section"]["missing"]
+        assert ini_config["missing"].lookup("flag") is NoValue
+
+    def test_parser(self, ini_config):
+        parser = ini_config.parser
+        assert parser.get("section", "flag") == "True"
+        assert parser.getboolean("section", "FLAG") is True
+        assert parser.options("section")[0] == "flag"
+
+
+class TestTraversal:
+    def test_children_cached(self, files_directory):
+        config = RecursiveConfig(files_directory / "config")["embedded"]
+        assert config["first"] is config["first"]
+        assert config["first"]["first_a"] is config.lookup("first")["first_a"]
+
+    def test_dict_copied(self, files_directory):
+        d = RecursiveConfig(files_directory / "config")["general"].dict()
+        d["hpc"]["hpc_mode"] = "modified"
+
+        config = RecursiveConfig(files_directory / "config")["general"]
+        assert config["hpc"]["hpc_mode"] is False
+        assert config.dict()["hpc"]["hpc_mode"] is False
+
+    def test_positional(self, label_config):
+        assert len(label_config) == 2
+        assert label_config[0][0] == "label"
+        assert label_config["label"][1] == ("centre_1", "y")
+
+    def test_slots(self, files_directory):
+        config = conf.Config(files_directory / "config")
+        for obj in (
+            config.dict,
+            config.dict.lookup("label"),
+            RecursiveConfig(files_directory / "config")["embedded"]["first"],
+            NamedConfig(files_directory / "config" / "label.ini")["label"],
+        ):
+            assert not hasattr(obj, "__dict__")
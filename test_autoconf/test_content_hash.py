@@ -0,0 +1,96 @@
+import shutil
+
+import pytest
+
+from autoconf import conf
+from autoconf.archive import pack
+
+
+@pytest.fixture(name="content_hash")
+def make_content_hash(config):
+    return config.content_hash
+
+
+def test_stable(files_directory, content_hash):
+    assert (
+        conf.Config(files_directory / "config", files_directory / "default").content_hash
+        == content_hash
+    )
+
+
+def test_same_content_elsewhere(files_directory, tmp_path, content_hash):
+    shutil.copytree(files_directory / "config", tmp_path / "config")
+    pack(files_directory / "default", tmp_path / "default.zip")
+
+    config = conf.Config(tmp_path / "config", tmp_path / "default.zip")
+    assert config.content_hash == content_hash
+
+
+def test_order(files_directory, content_hash):
+    config = conf.Config(files_directory / "default", files_directory / "config")
+    assert config.content_hash != content_hash
+
+
+def test_push(config, files_directory, content_hash):
+    config.push(files_directory / "default")
+    assert config.content_hash != content_hash
+
+
+def test_set(config, content_hash):
+    generation = config.generation
+    config["general"]["hpc"]["hpc_mode"] = True
+
+    assert config.generation > generation
+    assert config.content_hash != content_hash
+
+
+def test_override(config, content_hash):
+    generation = config.generation
+    with config.override("general", "hpc", "hpc_mode", value=True):
+        assert config.generation > generation
+        assert config.content_hash != content_hash
+    assert config.content_hash == content_hash
+
+
+def test_reload(files_directory, tmp_path):
+    shutil.copytree(files_directory / "config", tmp_path / "config")
+    config = conf.Config(tmp_path / "config")
+    content_hash = config.content_hash
+    generation = config.generation
+
+    (tmp_path / "config" / "general.yaml").write_text("hpc:\n  hpc_mode: true\n  a: 1\n")
+    config.reload([(tmp_path / "config", "general.yaml")])
+
+    assert config.generation > generation
+    assert config.content_hash != content_hash
+
+
+def test_discarded_edit(files_directory, tmp_path):
+    (tmp_path / "general.yaml").write_text("hpc:\n  hpc_mode: extra\n")
+
+    edited_first = conf.Config(files_directory / "config")
+    edited_first["general"]["hpc"]["hpc_mode"] = "edited"
+    edited_first.push(tmp_path)
+
+    pushed_first = conf.Config(files_directory / "config")
+    pushed_first.push(tmp_path)
+    pushed_first["general"]["hpc"]["hpc_mode"] = "edited"
+
+    assert edited_first["general"]["hpc"]["hpc_mode"] == "extra"
+    assert pushed_first["general"]["hpc"]["hpc_mode"] == "edited"
+    assert edited_first.content_hash != pushed_first.content_hash
+    assert (
+        edited_first.content_hash
+        == conf.Config(tmp_path, files_directory / "config").content_hash
+    )
+
+
+def test_rebuilt_edit(files_directory, content_hash):
+    config = conf.Config(files_directory / "config", files_directory / "default")
+    config["general"]["hpc"]["hpc_mode"] = "edited"
+
+    config.push(files_directory / "default")
+    config.push(files_directory / "config")
+
+    assert config["general"]["hpc"]["hpc_mode"] is False
+    assert config.content_hash == content_hash
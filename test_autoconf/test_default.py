@@ -1,4 +1,10 @@
-from autoconf.mock.mock_real import Redshift
+import numpy as np
+import pytest
+
+from autoconf.directory_config import NoValue
+from autoconf.exc import ConfigException
+from autoconf.json_prior.config import JSONPriorConfig
+from autoconf.mock.mock_real import Gaussian, Redshift
 
 
 def test_override_file(session_config):
@@ -86,3 +92,162 @@ def test_mix_files(session_config):
     assert embedded_dict["four"] == "five"
     assert embedded_dict["six"] == "seven"
     assert embedded_dict["eight"] == "nine"
+
+
+def test_lazy(config):
+    assert config["general"]["hpc"]["hpc_mode"] is False
+    assert list(config.dict._dict) == ["general"]
+
+
+def test_merged_keys(config):
+    assert set(config["general"]) == {"hpc", "output"}
+    assert {"default", "default_file", "embedded", "general"} <= set(config)
+
+
+def test_delete_override(config):
+    hpc = config["general"]["hpc"]
+    del hpc["hpc_mode"]
+
+    assert "hpc_mode" not in hpc
+    assert hpc["default_field"] == "hello"
+
+
+@pytest.fixture(name="extra_directory")
+def make_extra_directory(tmp_path):
+    (tmp_path / "extra.yaml").write_text("section:\n  key: value\n")
+    (tmp_path / "general.yaml").write_text("hpc:\n  default_field: extra\n")
+    return tmp_path
+
+
+def test_push_keeps_unaffected(config, extra_directory):
+    embedded = config["embedded"]
+    prior_config = config.prior_config.prior_configs[0]
+
+    config.push(extra_directory)
+
+    assert config["embedded"] is embedded
+    assert config["extra"]["section"]["key"] == "value"
+    assert config["general"]["hpc"]["default_field"] == "extra"
+    assert config["general"]["hpc"]["hpc_mode"] is False
+    assert config.prior_config.prior_configs[1] is prior_config
+    assert str(extra_directory) in config.dict.paths_string
+
+
+def test_push_restores_deleted(config, extra_directory):
+    del config["general"]["hpc"]["default_field"]
+    del config["general"]["hpc"]["hpc_mode"]
+
+    config.push(extra_directory)
+
+    assert config["general"]["hpc"]["default_field"] == "extra"
+    assert "hpc_mode" not in config["general"]["hpc"]
+
+
+def test_push_removes_layer(config, files_directory):
+    assert config["default"]["other"]["section"]["key"] == "value"
+
+    config.push(files_directory / "default")
+
+    assert config["default"]["other"]["section"]["key"] == "value"
+    assert config["general"]["hpc"]["hpc_mode"] is True
+
+
+def test_get(config):
+    assert config.get("general.hpc.hpc_mode") is False
+    assert config.get("General.HPC.hpc_mode") is False
+    assert config.get("general.hpc.missing", default=1) == 1
+    assert config.get("general.hpc.hpc_mode.missing") is None
+
+
+def test_get_invalidated(config, files_directory):
+    generation = config.generation
+    assert config.get("general.hpc.hpc_mode") is False
+
+    config["general"]["hpc"]["hpc_mode"] = "override"
+    assert config.generation > generation
+    assert config.get("general.hpc.hpc_mode") == "override"
+
+    config.push(files_directory / "default")
+    assert config.get("general.hpc.hpc_mode") is True
+
+
+def test_get_changed_while_resolving(config, monkeypatch):
+    resolve_path = config._resolve_path
+
+    def resolve_then_change(path):
+        value = resolve_path(path)
+        # Another thread edits configuration and caches a lookup meanwhile
+        monkeypatch.setattr(config, "_resolve_path", resolve_path)
+        config["general"]["hpc"]["hpc_mode"] = "edited"
+        config.get("general.hpc.default_field")
+        return value
+
+    monkeypatch.setattr(config, "_resolve_path", resolve_then_change)
+
+    assert config.get("general.hpc.hpc_mode") is False
+    assert config.get("general.hpc.hpc_mode") == "edited"
+
+
+def test_prior_cache(config, files_directory):
+    prior_config = config.prior_config
+    first = prior_config.for_class_and_suffix_path(Redshift, ["redshift"])
+    assert prior_config.for_class_and_suffix_path(Redshift, ["redshift"]) is first
+    assert (Redshift, ("redshift",)) in prior_config._cache
+
+    config.push(files_directory / "default")
+    assert config.prior_config is not prior_config
+    assert config.prior_config._cache == {}
+
+
+def test_prior_cache_miss(config, monkeypatch):
+    calls = []
+    lookup = JSONPriorConfig.lookup_for_class_and_suffix_path
+
+    def counting_lookup(self, cls, path, default=NoValue):
+        calls.append(path)
+        return lookup(self, cls, path, default)
+
+    monkeypatch.setattr(
+        JSONPriorConfig, "lookup_for_class_and_suffix_path", counting_lookup
+    )
+    for _ in range(3):
+        with pytest.raises(ConfigException):
+            config.prior_config.for_class_and_suffix_path(Redshift, ["missing"])
+    assert len(calls) == len(config.prior_config.prior_configs)
+
+
+def test_prior_arrays(config):
+    config.push_dict(
+        {
+            "priors": {
+                "autoconf.mock.mock_real.Gaussian": {
+                    "sigma": {
+                        "type": "Gaussian",
+                        "mean": 1.0,
+                        "sigma": 0.5,
+                        "width_modifier": {"type": "Relative", "value": 0.1},
+                        "limits": {"lower": 0.0, "upper": "inf"},
+                    }
+                }
+            }
+        }
+    )
+    arrays = config.prior_config.arrays_for_classes_and_suffix_paths(
+        [(Redshift, ["redshift"]), (Gaussian, ["sigma"])]
+    )
+
+    assert list(arrays["type"]) == ["Uniform", "Gaussian"]
+    assert list(arrays["width_modifier_type"]) == ["", "Relative"]
+    assert arrays["upper_limit"][0] == 3.0
+    assert np.isnan(arrays["upper_limit"][1])
+    assert arrays["mean"][1] == 1.0
+    assert arrays["sigma"][1] == 0.5
+    assert arrays["width_modifier_value"][1] == 0.1
+    assert arrays["limits_upper"][1] == np.inf
+
+
+def test_prior_arrays_missing(config):
+    with pytest.raises(ConfigException):
+        config.prior_config.arrays_for_classes_and_suffix_paths(
+            [(Redshift, ["missing"])]
+        )
@@ -0,0 +1,77 @@
+import os
+
+from autoconf.mock.mock_real import Gaussian, Redshift
+
+
+def test_override_value(config):
+    config.push_dict({"general": {"hpc": {"hpc_mode": True}}})
+
+    assert config["general"]["hpc"]["hpc_mode"] is True
+    assert config["general"]["hpc"]["default_field"] == "hello"
+    assert len(config.configs) == 3
+
+
+def test_keep_first(config):
+    config.push_dict({"general": {"hpc": {"hpc_mode": "dict"}}}, keep_first=True)
+
+    assert config["general"]["hpc"]["hpc_mode"] is False
+    assert config.configs[1].path.startswith("<dict")
+
+
+def test_replace(config):
+    config.push_dict({"general": {"hpc": {"hpc_mode": 1}}}, name="sweep")
+    config.push_dict({"general": {"hpc": {"hpc_mode": 2}}}, name="sweep")
+
+    assert config["general"]["hpc"]["hpc_mode"] == 2
+    assert len(config.configs) == 3
+
+
+def test_family(config):
+    assert config["label"]["superscript"].family(Gaussian) == "l"
+
+    config.push_dict({"label": {"superscript": {"Gaussian": "dict"}}})
+    assert config["label"]["superscript"].family(Gaussian) == "dict"
+
+
+def test_priors(config):
+    config.push_dict(
+        {
+            "priors": {
+                "autoconf.mock.mock_real": {
+                    "Redshift": {"redshift": {"type": "Uniform", "upper_limit": 9.0}}
+                }
+            }
+        }
+    )
+
+    prior_config = config.prior_config
+    assert (
+        prior_config.for_class_and_suffix_path(Redshift, ["redshift"])["upper_limit"]
+        == 9.0
+    )
+    assert "priors" not in config.dict
+
+
+def test_no_filesystem(config, monkeypatch):
+    assert config["general"]["hpc"]["default_field"] == "hello"
+
+    def fail(*args, **kwargs):
+        raise AssertionError("filesystem accessed")
+
+    monkeypatch.setattr(os, "scandir", fail)
+    monkeypatch.setattr(os, "stat", fail)
+
+    for i in range(3):
+        config.push_dict({"general": {"hpc": {"hpc_mode": i}}}, name="sweep")
+        assert config["general"]["hpc"]["hpc_mode"] == i
+        assert config["general"]["hpc"]["default_field"] == "hello"
+
+
+def test_content_hash(config, session_config):
+    content_hash = config.content_hash
+    config.push_dict({"general": {"hpc": {"hpc_mode": True}}}, name="sweep")
+    changed = config.content_hash
+    assert changed != content_hash
+
+    config.push_dict({"general": {"hpc": {"hpc_mode": True}}}, name="sweep")
+    assert config.content_hash == changed
@@ -0,0 +1,136 @@
+import os
+import pickle
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pytest
+
+import autoconf
+from autoconf.frozen import FrozenConfig
+from autoconf.mock.mock_real import Redshift, Gaussian
+
+
+@pytest.fixture(name="frozen")
+def make_frozen(config):
+    return config.freeze()
+
+
+def test_values(frozen):
+    assert frozen["general"]["hpc"]["hpc_mode"] is False
+    assert frozen["GENERAL"]["HPC"]["default_field"] == "hello"
+    assert frozen.get("general.hpc.hpc_mode") is False
+    assert frozen.get("general.missing", default=1) == 1
+
+
+def test_overrides(config):
+    with config.override("general", "hpc", "hpc_mode", value=True):
+        with config.override_output_path("temp"):
+            frozen = config.freeze()
+
+    assert frozen["general"]["hpc"]["hpc_mode"] is True
+    assert frozen.output_path == "temp"
+    assert config.freeze()["general"]["hpc"]["hpc_mode"] is False
+
+
+def test_immutable(frozen):
+    with pytest.raises(TypeError):
+        frozen["general"] = 1
+
+
+def test_family(frozen):
+    assert frozen["label"]["superscript"].family(Gaussian) == "l"
+
+
+def test_pickle(frozen):
+    loaded = pickle.loads(pickle.dumps(frozen))
+
+    assert loaded.dict() == frozen.dict()
+    assert loaded.paths == frozen.paths
+    assert (
+        loaded.prior_config.for_class_and_suffix_path(Redshift, ["redshift"])[
+            "upper_limit"
+        ]
+        == 3.0
+    )
+
+
+def read_from_shared_memory(name):
+    return FrozenConfig.from_shared_memory(name).get("general.hpc.hpc_mode")
+
+
+def test_shared_memory(frozen):
+    block = frozen.to_shared_memory()
+    try:
+        loaded = FrozenConfig.from_shared_memory(block.name)
+        assert loaded.dict() == frozen.dict()
+
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            assert executor.submit(read_from_shared_memory, block.name).result() is False
+    finally:
+        block.close()
+        block.unlink()
+
+
+POOL_SCRIPT = """
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from autoconf import conf
+from autoconf.frozen import FrozenConfig
+
+
+def read(name):
+    return FrozenConfig.from_shared_memory(name).get("general.hpc.hpc_mode")
+
+
+if __name__ == "__main__":
+    block = conf.Config(sys.argv[1]).freeze().to_shared_memory()
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        print(list(executor.map(read, [block.name] * 4)))
+    block.close()
+    block.unlink()
+"""
+
+
+def run_python(args, tmp_path):
+    return subprocess.run(
+        [sys.executable, *args],
+        capture_output=True,
+        text=True,
+        cwd=tmp_path,
+        env={**os.environ, "PYTHONPATH": str(Path(autoconf.__file__).parent.parent)},
+        timeout=60,
+    )
+
+
+def test_shared_memory_pool(files_directory, tmp_path):
+    script = tmp_path / "pool.py"
+    script.write_text(POOL_SCRIPT)
+
+    # The resource tracker reports errors on the stderr it shares with the script
+    result = run_python([str(script), str(files_directory / "config")], tmp_path)
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == str([False] * 4)
+    assert "Traceback" not in result.stderr
+
+
+def test_shared_memory_other_process(frozen, tmp_path):
+    block = frozen.to_shared_memory()
+    try:
+        result = run_python(
+            [
+                "-c",
+                "from autoconf.frozen import FrozenConfig; "
+                f"FrozenConfig.from_shared_memory({block.name!r})",
+            ],
+            tmp_path,
+        )
+        assert result.returncode == 0, result.stderr
+
+        assert FrozenConfig.from_shared_memory(block.name).dict() == frozen.dict()
+    finally:
+        block.close()
+        block.unlink()
@@ -0,0 +1,68 @@
+import csv
+import json
+
+import pytest
+
+from autoconf import conf
+from autoconf.instrumentation import instrumentation
+from autoconf.mock.mock_real import Redshift
+
+
+@pytest.fixture(name="instrumented")
+def make_instrumented():
+    instrumentation.reset()
+    instrumentation.enable()
+    yield instrumentation
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+def test_module_not_shadowed():
+    import autoconf
+    import autoconf.instrumentation as module
+
+    assert autoconf.instrumentation is module
+    assert module.INSTRUMENT_ENVIRONMENT_VARIABLE == "PYAUTO_CONFIG_INSTRUMENT"
+    assert module.instrumentation is instrumentation
+
+
+def test_disabled_restores_methods():
+    original = conf.DictWrapper.lookup
+    instrumentation.enable()
+    assert conf.DictWrapper.lookup is not original
+    instrumentation.disable()
+    assert conf.DictWrapper.lookup is original
+
+
+def test_report(instrumented, files_directory):
+    config = conf.Config(files_directory / "config", files_directory / "default")
+    assert config["general"]["hpc"]["hpc_mode"] is False
+    assert config["general"]["hpc"]["hpc_mode"] is False
+    assert "missing" not in config["general"]
+    config.prior_config.for_class_and_suffix_path(Redshift, ["redshift"])
+
+    report = instrumented.report()
+
+    assert report["operations"]["Config.__getitem__"]["count"] == 3
+    assert report["key_paths"]["general.hpc.hpc_mode"]["count"] == 2
+    assert report["key_paths"]["general.missing"]["misses"] == 1
+    assert report["lookup_cache"]["hits"] >= 3
+    assert (
+        report["operations"]["PriorConfigWrapper.for_class_and_suffix_path"]["count"]
+        == 1
+    )
+    assert report["operations"]["RecursiveConfig._getitem"]["count"] >= 2
+
+
+def test_dump(instrumented, files_directory, tmp_path):
+    config = conf.Config(files_directory / "config")
+    config["general"]
+
+    instrumented.dump(tmp_path / "report.json")
+    instrumented.dump(tmp_path / "report.csv")
+
+    with open(tmp_path / "report.json") as f:
+        assert "general" in json.load(f)["key_paths"]
+    with open(tmp_path / "report.csv") as f:
+        rows = list(csv.reader(f))
+    assert ["key_paths", "general"] in [row[:2] for row in rows]
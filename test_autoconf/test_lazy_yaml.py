@@ -0,0 +1,118 @@
+import pytest
+import yaml
+
+from autoconf import conf, lazy_yaml
+from autoconf.lazy_yaml import LazyYAMLDocument, index
+
+DOCUMENT = b"""# comment
+first:
+  a: 1
+  b: [1, 2]
+
+second: value
+third_key:
+  nested:
+    deeper: true
+"""
+
+
+def test_index():
+    offsets = index(DOCUMENT)
+    assert list(offsets) == ["first", "second", "third_key"]
+    start, end = offsets["second"]
+    assert DOCUMENT[start:end] == b"second: value\n"
+
+
+@pytest.mark.parametrize(
+    "document",
+    [
+        b"first: &anchor\n  a: 1\nsecond: *anchor\n",
+        b"first: 1\n---\nsecond: 2\n",
+        b"first: !!str 1\n",
+        b"1: one\n",
+        b"yes: one\n",
+        b"- item\n",
+        b"{first: 1}\n",
+        b'key: "long\nfoo: bar"\nother: 1\n',
+        b"key: 'it''s\nfoo: bar'\nother: 1\n",
+        b"key: [1,\nfoo: bar]\nother: 1\n",
+        b"key: {a: 1,\nfoo: bar}\nother: 1\n",
+        b'key: "unclosed\nfoo: bar\n',
+    ],
+)
+def test_unsupported(document):
+    assert index(document) is None
+
+
+@pytest.mark.parametrize(
+    "document",
+    [
+        b"key: 'it''s'  # don't\nother: [1, '2]']\nlast: \"a \\\" b\"\n",
+        b"key: it's\nother: 1\n",
+    ],
+)
+def test_quotes_closed(document):
+    offsets = index(document)
+    assert offsets is not None
+    assert dict(LazyYAMLDocument(document, offsets)) == yaml.safe_load(document)
+
+
+def split(document, keys):
+    starts = [document.index(key.encode()) for key in keys] + [len(document)]
+    return {key: (starts[i], starts[i + 1]) for i, key in enumerate(keys)}
+
+
+@pytest.mark.parametrize(
+    "document, keys, key",
+    [
+        (b'key: "long\nfoo: bar"\nother: 1\n', ["key", "foo", "other"], "key"),
+        (b"key: 1\nfoo: 2\nother: 3\n", ["key", "other"], "key"),
+    ],
+)
+def test_section_fallback(document, keys, key):
+    lazy = LazyYAMLDocument(document, split(document, keys))
+
+    assert lazy[key] == yaml.safe_load(document)[key]
+    assert dict(lazy) == yaml.safe_load(document)
+
+
+def test_lazy_document():
+    document = LazyYAMLDocument(DOCUMENT, index(DOCUMENT))
+
+    assert len(document) == 3
+    assert document.parsed == 0
+    assert document["third_key"] == {"nested": {"deeper": True}}
+    assert document.parsed == 1
+    assert dict(document) == yaml.safe_load(DOCUMENT)
+
+
+@pytest.fixture(name="lazy")
+def make_lazy(monkeypatch):
+    monkeypatch.setattr(lazy_yaml, "lazy_threshold", 0)
+
+
+def test_load(lazy, tmp_path):
+    path = tmp_path / "visualize.yaml"
+    path.write_bytes(DOCUMENT)
+
+    assert isinstance(lazy_yaml.load_yaml(path), LazyYAMLDocument)
+
+
+def test_load_small(tmp_path):
+    path = tmp_path / "visualize.yaml"
+    path.write_bytes(DOCUMENT)
+
+    assert lazy_yaml.load_yaml(path) == yaml.safe_load(DOCUMENT)
+
+
+def test_config(lazy, tmp_path):
+    (tmp_path / "visualize.yaml").write_bytes(DOCUMENT)
+    config = conf.Config(tmp_path)
+
+    assert config["visualize"]["third_key"]["nested"]["deeper"] is True
+    assert config.get("visualize.second") == "value"
+
+    document = config.configs[0]["visualize"]._dict
+    assert isinstance(document, LazyYAMLDocument)
+    assert document.parsed == 2
+    assert config.dict.dict()["visualize"] == yaml.safe_load(DOCUMENT)
@@ -0,0 +1,130 @@
+import asyncio
+import pickle
+import threading
+
+import pytest
+
+from autoconf.tools.lock import ReadWriteLock
+
+
+class MockClass:
+    pass
+
+
+class OtherClass:
+    pass
+
+
+def test_override(config):
+    with config.override("general", "hpc", "hpc_mode", value="override"):
+        assert config["general"]["hpc"]["hpc_mode"] == "override"
+        assert config.get("general.hpc.hpc_mode") == "override"
+
+    assert config["general"]["hpc"]["hpc_mode"] is False
+    assert config.get("general.hpc.hpc_mode") is False
+
+
+def test_override_views(config):
+    with config.override("general", "hpc", "hpc_mode", value="override"):
+        hpc = config["general"]["hpc"]
+        assert dict(hpc.items())["hpc_mode"] == "override"
+        assert "hpc_mode" in list(hpc)
+        assert config["general"].dict()["hpc"]["hpc_mode"] == "override"
+        assert config.dict.dict()["general"]["hpc"]["hpc_mode"] == "override"
+
+    assert config["general"].dict()["hpc"]["hpc_mode"] is False
+
+
+def test_override_new_key(config):
+    with config.override("General", "HPC", "new_key", value=1):
+        assert config["general"]["hpc"]["new_key"] == 1
+    assert "new_key" not in config["general"]["hpc"]
+
+
+def test_threads(config):
+    results = dict()
+    barrier = threading.Barrier(4)
+
+    def run(i):
+        with config.override("general", "hpc", "hpc_mode", value=i):
+            barrier.wait()
+            results[i] = config["general"]["hpc"]["hpc_mode"]
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == {i: i for i in range(4)}
+
+
+def test_family_threads(config):
+    superscript = config["label"]["superscript"]
+
+    def miss(cls):
+        with pytest.raises(KeyError):
+            superscript.family(cls)
+
+    with config.override("label", "superscript", "MockClass", value="m"):
+        thread = threading.Thread(target=miss, args=(MockClass,))
+        thread.start()
+        thread.join()
+
+        assert superscript.family(MockClass) == "m"
+        miss(OtherClass)
+
+    assert OtherClass not in superscript._family_misses
+
+
+def test_tasks(config):
+    async def run(i):
+        with config.override("general", "hpc", "hpc_mode", value=i):
+            await asyncio.sleep(0)
+            return config["general"]["hpc"]["hpc_mode"]
+
+    async def main():
+        return await asyncio.gather(*(run(i) for i in range(3)))
+
+    assert asyncio.run(main()) == [0, 1, 2]
+
+
+def test_output_path(config):
+    config.output_path = "output"
+    with config.override_output_path("temp"):
+        assert config.output_path == "temp"
+    assert config.output_path == "output"
+
+
+def test_push_in_output_path_override(config, files_directory):
+    config.output_path = "output"
+    with config.override_output_path("temp"):
+        config.push(files_directory / "default")
+        assert config.output_path == "temp"
+    assert config.output_path == "output"
+
+
+def test_pickle(config):
+    config["general"]["hpc"]["edited"] = 1
+    assert config.prior_config is not None
+
+    loaded = pickle.loads(pickle.dumps(config))
+    assert loaded["general"]["hpc"]["hpc_mode"] is False
+    assert loaded["general"]["hpc"]["edited"] == 1
+    assert loaded["general"]["hpc"].owner is loaded
+    with loaded.override("general", "hpc", "hpc_mode", value=True):
+        assert loaded["general"]["hpc"]["hpc_mode"] is True
+
+    assert pickle.loads(pickle.dumps(config.dict))["general"]["hpc"]["edited"] == 1
+    assert pickle.loads(pickle.dumps(config["general"]["hpc"]))["hpc_mode"] is False
+
+
+def test_lock_reentrant():
+    lock = ReadWriteLock()
+    with lock.write():
+        with lock.read():
+            with lock.write():
+                pass
+    with lock.read():
+        with lock.read():
+            pass
@@ -0,0 +1,72 @@
+import os
+
+import pytest
+
+from autoconf.directory_config import YAMLConfig, NamedConfig
+from autoconf.parse_cache import ParseCache, parse_cache
+
+
+@pytest.fixture(name="yaml_path")
+def make_yaml_path(tmp_path):
+    path = tmp_path / "general.yaml"
+    path.write_text("output:\n  identifier_version: 4\n")
+    return path
+
+
+@pytest.fixture(name="cache")
+def make_cache():
+    return ParseCache(maxsize=2)
+
+
+def test_hit(cache, yaml_path):
+    first = cache.load(yaml_path, str)
+    second = cache.load(yaml_path, str)
+
+    assert first is second
+    assert cache.misses == 1
+    assert cache.hits == 1
+    assert cache.hit_rate == 0.5
+
+
+def test_modified(cache, yaml_path):
+    cache.load(yaml_path, str)
+
+    yaml_path.write_text("output:\n  identifier_version: 5\n  other: 1\n")
+    os.utime(yaml_path, ns=(0, 0))
+    cache.load(yaml_path, str)
+
+    assert cache.misses == 2
+    assert len(cache) == 1
+
+
+def test_bounded(cache, tmp_path):
+    for i in range(3):
+        path = tmp_path / f"{i}.yaml"
+        path.write_text("a: 1")
+        cache.load(path, str)
+
+    assert len(cache) == 2
+
+
+def test_clear(cache, yaml_path):
+    cache.load(yaml_path, str)
+    cache.clear()
+
+    assert len(cache) == 0
+    assert cache.misses == 0
+
+
+def test_missing(cache, tmp_path):
+    with pytest.raises(FileNotFoundError):
+        cache.load(tmp_path / "missing.yaml", str)
+
+
+def test_shared_between_configs(yaml_path):
+    assert YAMLConfig(yaml_path)._dict is YAMLConfig(yaml_path)._dict
+    assert YAMLConfig(yaml_path)["output"]["identifier_version"] == 4
+
+
+def test_named_config(files_directory):
+    path = files_directory / "config" / "label.ini"
+    assert NamedConfig(path).sections is NamedConfig(path).sections
+    assert parse_cache.hits > 0
@@ -0,0 +1,47 @@
+import pytest
+
+from autoconf import conf, parsers
+from autoconf.directory_config import RecursiveConfig, config_suffixes
+from autoconf.json_prior.config import JSONPriorConfig
+
+
+@pytest.fixture(name="config_directory")
+def make_config_directory(tmp_path):
+    (tmp_path / "json_file.json").write_text('{"section": {"key": "json"}}')
+    (tmp_path / "toml_file.toml").write_text('[section]\nkey = "toml"\n')
+    (tmp_path / "both.yaml").write_text("section:\n  key: yaml\n")
+    (tmp_path / "both.json").write_text('{"section": {"key": "json"}}')
+    return tmp_path
+
+
+def test_suffix_priority():
+    assert config_suffixes()[:3] == (".ini", ".yml", ".yaml")
+    assert ".json" in config_suffixes()
+
+
+def test_json_and_toml(config_directory):
+    config = RecursiveConfig(config_directory)
+    assert config["json_file"]["section"]["key"] == "json"
+    if ".toml" in parsers.suffixes():
+        assert config["toml_file"]["section"]["key"] == "toml"
+
+
+def test_yaml_before_json(config_directory):
+    assert conf.Config(config_directory)["both"]["section"]["key"] == "yaml"
+
+
+def test_register_parser(tmp_path, monkeypatch):
+    monkeypatch.setattr(parsers, "_parsers", dict(parsers._parsers))
+    parsers.register_parser(".txt", lambda path: {"section": {"key": "text"}})
+    (tmp_path / "text.txt").write_text("anything")
+
+    assert RecursiveConfig(tmp_path)["text"]["section"]["key"] == "text"
+
+
+def test_priors(tmp_path):
+    (tmp_path / "module.json").write_text('{"Class": {"x": 1}}')
+    (tmp_path / "other.yml").write_text("Class:\n  y: 2\n")
+
+    config = JSONPriorConfig.from_directory(tmp_path)
+    assert config(["module", "Class", "x"]) == 1
+    assert config(["other", "Class", "y"]) == 2
@@ -0,0 +1,97 @@
+import datetime
+import json
+import os
+
+import pytest
+
+from autoconf import conf
+from autoconf.directory_config import DictConfig, DirectoryManifest
+from autoconf.snapshot import ConfigSnapshot
+
+
+@pytest.fixture(name="config_directory")
+def make_config_directory(tmp_path):
+    directory = tmp_path / "config"
+    directory.mkdir()
+    (directory / "general.yaml").write_text("hpc:\n  hpc_mode: true\n")
+    (directory / "label.ini").write_text("[label]\ncentre_0=x\n")
+    return directory
+
+
+@pytest.fixture(name="snapshot_directory")
+def make_snapshot_directory(tmp_path):
+    return tmp_path / "snapshots"
+
+
+def make_config(config_directory, snapshot_directory):
+    return conf.Config(config_directory, snapshot_directory=snapshot_directory)
+
+
+def test_override_not_saved(config_directory, snapshot_directory):
+    config = make_config(config_directory, snapshot_directory)
+    with config.override("general", "hpc", "hpc_mode", value="override"):
+        assert config["general"]["hpc"]["hpc_mode"] == "override"
+
+    snapshot = ConfigSnapshot(
+        snapshot_directory, [DirectoryManifest(config_directory)]
+    )
+    assert snapshot.load()["general"]["hpc"]["hpc_mode"] is True
+
+
+def test_snapshot_written(config_directory, snapshot_directory):
+    config = make_config(config_directory, snapshot_directory)
+    assert config["general"]["hpc"]["hpc_mode"] is True
+
+    snapshot = ConfigSnapshot(
+        snapshot_directory, [DirectoryManifest(config_directory)]
+    )
+    assert snapshot.load() == {
+        "general": {"hpc": {"hpc_mode": True}},
+        "label": {"label": {"centre_0": "x"}},
+    }
+
+
+def test_snapshot_used(config_directory, snapshot_directory):
+    make_config(config_directory, snapshot_directory).dict
+
+    config = make_config(config_directory, snapshot_directory)
+    assert isinstance(config.dict._layers[0], DictConfig)
+    assert config["label"]["label"]["centre_0"] == "x"
+
+
+def test_snapshot_invalidated(config_directory, snapshot_directory):
+    make_config(config_directory, snapshot_directory).dict
+
+    path = config_directory / "general.yaml"
+    path.write_text("hpc:\n  hpc_mode: false\n")
+    os.utime(path, ns=(0, 0))
+
+    config = make_config(config_directory, snapshot_directory)
+    assert not isinstance(config.dict._layers[0], DictConfig)
+    assert config["general"]["hpc"]["hpc_mode"] is False
+
+
+def test_no_snapshot(config_directory):
+    config = conf.Config(config_directory)
+    assert config.snapshot_directory is None
+    assert config["general"]["hpc"]["hpc_mode"] is True
+
+
+def test_snapshot_is_json(config_directory, snapshot_directory):
+    make_config(config_directory, snapshot_directory).dict
+
+    snapshot = ConfigSnapshot(
+        snapshot_directory, [DirectoryManifest(config_directory)]
+    )
+    with open(snapshot.path) as f:
+        assert json.load(f)["tree"]["label"] == {"label": {"centre_0": "x"}}
+
+
+def test_snapshot_not_json(config_directory, snapshot_directory):
+    (config_directory / "dates.yaml").write_text("start: 2020-01-01\n")
+    config = make_config(config_directory, snapshot_directory)
+    assert config["dates"]["start"] == datetime.date(2020, 1, 1)
+
+    assert not snapshot_directory.exists() or not list(snapshot_directory.iterdir())
+    config = make_config(config_directory, snapshot_directory)
+    assert config["dates"]["start"] == datetime.date(2020, 1, 1)
@@ -0,0 +1,130 @@
+import os
+import shutil
+
+import pytest
+
+from autoconf import conf
+from autoconf.archive import pack
+from autoconf.mock.mock_real import Redshift
+from autoconf.watcher import ConfigWatcher
+
+
+def edit(path, text):
+    """
+    Write a file and give it a new modification time so the change is seen even
+    if it happens within the filesystem's timestamp resolution.
+    """
+    stat = os.stat(path) if path.exists() else None
+    path.write_text(text)
+    if stat is not None:
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture(name="directory")
+def make_directory(files_directory, tmp_path):
+    shutil.copytree(files_directory / "config", tmp_path / "config")
+    shutil.copytree(files_directory / "default", tmp_path / "default")
+    return tmp_path
+
+
+@pytest.fixture(name="watched")
+def make_watched(directory):
+    return conf.Config(directory / "config", directory / "default")
+
+
+@pytest.fixture(name="watcher")
+def make_watcher(watched):
+    return ConfigWatcher(watched)
+
+
+def test_no_changes(watcher):
+    assert watcher.poll() == []
+
+
+def test_edit_file(watched, watcher, directory):
+    assert watched["general"]["hpc"]["hpc_mode"] is False
+    text = watched["text"]
+    generation = watched.generation
+
+    edit(directory / "config" / "general.yaml", "hpc:\n  hpc_mode: true\n")
+
+    assert watcher.poll() == [(directory / "config", "general.yaml")]
+    assert watched["general"]["hpc"]["hpc_mode"] is True
+    assert watched["general"]["hpc"]["default_field"] == "hello"
+    assert watched["text"] is text
+    assert watched.generation > generation
+
+
+def test_nested_file(watched, watcher, directory):
+    assert watched["text"]["label"]["superscript"]["Galaxy"] == "g"
+    text = watched["text"]
+
+    edit(directory / "config" / "text" / "label.ini", "[superscript]\nGalaxy=h\n")
+    watcher.poll()
+
+    assert watched["text"] is text
+    assert watched["text"]["label"]["superscript"]["Galaxy"] == "h"
+
+
+def test_new_file(watched, watcher, directory):
+    assert "novel" not in watched.dict
+
+    edit(directory / "config" / "novel.yaml", "key: value\n")
+    watcher.poll()
+
+    assert watched["novel"]["key"] == "value"
+
+
+def test_removed_file(watched, watcher, directory):
+    assert watched["general"]["hpc"]["hpc_mode"] is False
+
+    os.remove(directory / "config" / "general.yaml")
+    watcher.poll()
+
+    assert watched["general"]["hpc"]["hpc_mode"] is True
+
+
+def test_priors(watched, watcher, directory):
+    assert (
+        watched.prior_config.for_class_and_suffix_path(Redshift, ["redshift"])[
+            "upper_limit"
+        ]
+        == 3.0
+    )
+    default_prior_config = watched.prior_config.prior_configs[1]
+
+    edit(
+        directory / "config" / "priors" / "mock_real.json",
+        '{"Redshift": {"redshift": {"type": "Uniform", "upper_limit": 5.0}}}',
+    )
+    watcher.poll()
+
+    assert (
+        watched.prior_config.for_class_and_suffix_path(Redshift, ["redshift"])[
+            "upper_limit"
+        ]
+        == 5.0
+    )
+    assert watched.prior_config.prior_configs[1] is default_prior_config
+
+
+def test_archive(directory, tmp_path):
+    archive = tmp_path / "config.zip"
+    pack(directory / "config", archive)
+    config = conf.Config(archive, directory / "default")
+    watcher = ConfigWatcher(config)
+    assert config["general"]["hpc"]["hpc_mode"] is False
+
+    edit(directory / "config" / "general.yaml", "hpc:\n  hpc_mode: true\n")
+    stat = os.stat(archive)
+    pack(directory / "config", archive)
+    os.utime(archive, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert watcher.poll() == [(archive, "")]
+    assert config["general"]["hpc"]["hpc_mode"] is True
+
+
+def test_background(watched):
+    with ConfigWatcher(watched, interval=0.01) as watcher:
+        assert watcher._thread.is_alive()
+    assert watcher._thread is None